@@ -14,6 +14,13 @@ LOG_DIR = BASE_DIR / "data" / "logs"
 REPORT_DIR = BASE_DIR / "outputs" / "reports"
 PPTX_DIR = BASE_DIR / "outputs" / "presentations"
 
+# Classified work orders written after each load
+PROCESSED_PATH = PROCESSED_DATA_DIR / "cleaned_work_orders.parquet"
+
+# Parsed Excel files cached as Parquet, keyed by path, mtime and size
+CACHE_DIR = BASE_DIR / "data" / "cache"
+CACHE_MAX_FILES = 20  # least recently used entries beyond this are deleted
+
 # Expected column mappings
 
 COLUMN_MAP ={
@@ -32,6 +39,14 @@ COLUMN_MAP ={
 
 MONTH_LOOKBACK = 12  # number of months to include
 
+# Stop light bands (green / yellow / red). Each level covers values up to and
+# including its threshold, e.g. with (4, 7): <= 4 green, <= 7 yellow, above 7 red.
+# The two conventions are intentional: the chart images band raw missed counts,
+# while the governance deck bands the missed percentage, Missed / (Missed + Completed)
+STOPLIGHT_COUNT_THRESHOLDS = (4, 7)    # missed work orders, scripts/charts
+STOPLIGHT_PERCENT_THRESHOLDS = (3, 6)  # missed %, slide_generator stoplight table
+STOPLIGHT_LABELS = ("✅ Acceptable", "⚠️ Caution", "❌ Critical")  # chart annotations, by level
+
 # PowerPoint slide targeting keywords (if automating updates)
 
 PPTX_TEXT_MAP = {
@@ -18,6 +18,10 @@
 #   - Users can select a file, choose report type, and generate/export reports.
 #   - Output files are saved in the 'outputs' directory.
 #   - GUI provides options for monthly summary and governance overview.
+#   - slide_generator (and python-pptx behind it) is imported only when a deck is
+#     built, so startup and the worker process don't pay for it up front.
+#   - The last LOAD_CACHE_MAX_ENTRIES loaded files are kept in memory, so re-picking
+#     one of them skips the reload.
 # ---------------------------------------------------------------
 
 # gui/wx_app.py
@@ -25,7 +29,9 @@
 import os
 import wx
 import pandas as pd
-import threading
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from scripts.data_loader import  load_work_order_files
 from scripts.summary_generator import (
@@ -37,11 +43,53 @@ from scripts.summary_generator import (
     generate_pm_breakdowns
 )
 from scripts.classifier import apply_classification
-from scripts.slide_generator import (
-    create_governance_slide,
-    create_full_governance_deck
-)
-from scripts.data_processor import prepare_data
+from scripts.data_processor import build_report_data, save_processed_data
+
+
+# Worker functions run in the dashboard's process pool, so they live at module
+# level (picklable) and never touch wx widgets directly.
+
+def load_file(file_path):
+    """Loads and classifies a work order file; the loader reuses its Parquet cache when present."""
+    # apply_classification adds columns in place, so only one frame is ever alive
+    df = apply_classification(load_work_order_files(file_path))
+    save_processed_data(df)
+    return df
+
+def run_report(df, report_choice, include_late_orders):
+    """Builds and exports the selected report; returns the report name on success."""
+    # Reuse the DataFrame classified at load time instead of re-reading the file
+    # FIX: Unpack all 8 return values including disposition_df
+    summary, by_group_df, trend_df, late_df, pm_month_df, ytd_df, df_classified, disposition_df = build_report_data(df)
+
+    if report_choice == "Monthly Summary":
+        # Include late orders in Excel if checkbox is checked
+        late_data = late_df if include_late_orders else None
+        export_summary_to_excel(summary, late_data)
+
+    elif report_choice == "Governance Overview":
+        from scripts.slide_generator import create_full_governance_deck
+
+        by_group_df = by_group_df[by_group_df["missed"] > 0]
+
+        # Pass late_df when checkbox is checked
+        late_data = late_df if include_late_orders else None
+        # FIX: Update function call to match the new signature
+        # create_full_governance_deck(by_month_df, late_df, disposition_df, by_group_df, filename)
+        create_full_governance_deck(trend_df, late_data, disposition_df, by_group_df, filename=None)
+
+        # If checkbox is checked, could add late orders to a separate slide
+        if include_late_orders and not late_df.empty:
+            # Could extend governance deck with late orders slide
+            pass
+    else:
+        raise ValueError(f"Unknown report: {report_choice}")
+
+    return report_choice
+
+
+# Classified frames kept for instant re-picks; older ones reload from the loader's Parquet cache
+LOAD_CACHE_MAX_ENTRIES = 3
 
 
 class WorkOrderDashboard(wx.Frame):
@@ -49,6 +97,12 @@ class WorkOrderDashboard(wx.Frame):
         super().__init__(parent, title=title, size=wx.Size(800, 500))
         self.panel = wx.Panel(self)
         self.df = None  # will hold the loaded DataFrame
+        self.load_cache = OrderedDict()  # (path, mtime, size) -> classified DataFrame, oldest first
+        self.load_future = None  # most recent load job; older results are ignored
+
+        # One persistent worker process keeps pandas work off the GUI thread and the GIL
+        self.pool = ProcessPoolExecutor(max_workers=1)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
 
         self.init_ui()
         self.Center()
@@ -101,69 +155,80 @@ class WorkOrderDashboard(wx.Frame):
 
     def on_file_selected(self, event):
         file_path = self.file_picker.GetPath()
+
+        # A newer pick supersedes any load still waiting in the pool
+        if self.load_future is not None:
+            self.load_future.cancel()
+            self.load_future = None
+
+        # Skip reloading when the same unchanged file is picked again. A path that
+        # can't be stat'ed (empty or deleted) just goes through a normal load,
+        # which reports the error
+        try:
+            cache_key = (file_path, os.path.getmtime(file_path), os.path.getsize(file_path))
+        except OSError:
+            cache_key = None
+        if cache_key is not None and cache_key in self.load_cache:
+            self.load_cache.move_to_end(cache_key)
+            self.df = self.load_cache[cache_key]
+            self.status_text.SetLabel(f"✅ Loaded: {os.path.basename(file_path)}")
+            return
+
         self.status_text.SetLabel("⏳ Loading file, please wait...")
+        future = self.pool.submit(load_file, file_path)
+        future.add_done_callback(lambda f: wx.CallAfter(self.on_file_loaded, f, file_path, cache_key))
+        self.load_future = future
+
+    def on_file_loaded(self, future, file_path, cache_key):
+        stale = future is not self.load_future
+        if future.cancelled() or (stale and future.exception() is not None):
+            return
+
+        try:
+            df = future.result()
+        except Exception as err:
+            self.df = None
+            self.status_text.SetLabel(f"❌ Load error: {err}")
+            return
 
-        def load_file():
-            try:
-                raw_df = load_work_order_files(file_path)
-                df = apply_classification(raw_df)
-                df["report_month"] = pd.to_datetime(df["target_date"], errors="coerce").dt.strftime("%b-%y")
-                processed_path = os.path.join("data", "processed", "cleaned_work_orders.csv")
-                df.to_csv(processed_path, index=False)
-                # Update self.df and status text on the GUI thread
-                def update_ui():
-                    self.df = df
-                    self.status_text.SetLabel(f"✅ Loaded: {os.path.basename(file_path)}")
-                wx.CallAfter(update_ui)
-            except Exception as err:
-                wx.CallAfter(self.status_text.SetLabel, f"❌ Load error: {err}")
-                wx.CallAfter(setattr, self, "df", None)
-
-        threading.Thread(target=load_file).start()
+        # A finished stale load is still worth caching, but must not replace the current file
+        if cache_key is not None:
+            self.load_cache[cache_key] = df
+            while len(self.load_cache) > LOAD_CACHE_MAX_ENTRIES:
+                self.load_cache.popitem(last=False)  # drop the least recently used frame
+        if stale:
+            return
+
+        self.load_future = None
+        self.df = df
+        self.status_text.SetLabel(f"✅ Loaded: {os.path.basename(file_path)}")
         
     def on_generate_report(self, event):
         if self.df is None:
             self.status_text.SetLabel("⚠️ Please load a file first.")
             return
 
-        def run_report():
-            try:
-                file_path = self.file_picker.GetPath()
-                # FIX: Unpack all 8 return values including disposition_df
-                summary, by_group_df, trend_df, late_df, pm_month_df, ytd_df, df_classified, disposition_df = prepare_data(file_path)
-
-                include_late_orders = self.include_late.GetValue()
-                
-                report_choice = self.report_type.GetValue()
-                if report_choice == "Monthly Summary":
-                    # Include late orders in Excel if checkbox is checked
-                    late_data = late_df if include_late_orders else None
-                    export_summary_to_excel(summary, late_data)
-                    
-                elif report_choice == "Governance Overview":
-                    by_group_df = by_group_df[by_group_df["missed"] > 0]
-                    
-                    # Pass late_df when checkbox is checked
-                    late_data = late_df if include_late_orders else None
-                    # FIX: Update function call to match the new signature
-                    # create_full_governance_deck(by_month_df, late_df, disposition_df, by_group_df, filename)
-                    create_full_governance_deck(trend_df, late_data, disposition_df, by_group_df, filename=None)
-                                
-                    # If checkbox is checked, could add late orders to a separate slide
-                    if include_late_orders and not late_df.empty:
-                        # Could extend governance deck with late orders slide
-                        pass
-                else:
-                    raise ValueError(f"Unknown report: {report_choice}")
-
-                wx.CallAfter(self.status_text.SetLabel, f"📊 {report_choice} exported successfully.")
-            except Exception as err:
-                print(f"Full error: {err}")
-                import traceback
-                traceback.print_exc()
-                wx.CallAfter(self.status_text.SetLabel, f"❌ Error: {err}")
-
-        threading.Thread(target=run_report).start()
+        # Read widget values here; the worker process cannot access them
+        report_choice = self.report_type.GetValue()
+        include_late_orders = self.include_late.GetValue()
+
+        future = self.pool.submit(run_report, self.df, report_choice, include_late_orders)
+        future.add_done_callback(lambda f: wx.CallAfter(self.on_report_done, f))
+
+    def on_report_done(self, future):
+        try:
+            report_choice = future.result()
+        except Exception as err:
+            print(f"Full error: {err}")
+            traceback.print_exception(type(err), err, err.__traceback__)
+            self.status_text.SetLabel(f"❌ Error: {err}")
+            return
+
+        self.status_text.SetLabel(f"📊 {report_choice} exported successfully.")
+
+    def on_close(self, event):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        event.Skip()
 
     def on_open_folder(self, event):
         target = os.path.abspath("outputs")
@@ -14,7 +14,6 @@ import wx
 # Import prepare_data from the new module
 from scripts.data_processor import prepare_data
 from scripts.summary_generator import export_summary_to_excel
-from scripts.slide_generator import create_full_governance_deck
 
 print("main.py started")
 
@@ -38,6 +37,9 @@ if __name__ == "__main__":
         file_path = sys.argv[1]
         print("File path argument:", file_path)
         try:
+            # Imported here so GUI mode never loads python-pptx at startup
+            from scripts.slide_generator import create_full_governance_deck
+
             # FIX: Unpack all 8 return values including disposition_df
             summary, by_group_df, trend_df, late_df, pm_month_df, ytd_df, df_classified, disposition_df = prepare_data(file_path)
             export_summary_to_excel(summary, late_df)
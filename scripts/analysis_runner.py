@@ -5,7 +5,7 @@
 #   Runs work order analysis from cleaned data and provides summary metrics.
 #
 # Requirements:
-#   - Input: 'cleaned_work_orders.csv' in 'data/processed' directory.
+#   - Input: 'cleaned_work_orders.parquet' (or a legacy .csv) in 'data/processed' directory.
 #   - Columns: Must include 'target_date' (date), 'OrderType', and other relevant fields.
 #
 # Output:
@@ -27,22 +27,28 @@ logging.basicConfig(
 )
 
 
-def load_cleaned_data(filepath="data/processed/cleaned_work_orders.csv"):
+def load_cleaned_data(filepath="data/processed/cleaned_work_orders.parquet"):
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"🚨 Missing file: {filepath}")
+    if filepath.endswith(".parquet"):
+        return pd.read_parquet(filepath)
     return pd.read_csv(filepath)
 
 def generate_summary(df):
     # Ensure target_date is datetime
-    df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce")
+    if not pd.api.types.is_datetime64_any_dtype(df["target_date"]):
+        df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce", cache=True)
 
     # Use the current calendar month, not the latest date in your data
     today = pd.Timestamp.today()
     first_of_current = today.replace(day=1)
     first_of_previous = (first_of_current - pd.DateOffset(months=1)).replace(day=1)
 
-    # Only include work orders due between first_of_previous (exclusive) and first_of_current (inclusive)
-    due_for_month = df[(df["target_date"] > first_of_previous) & (df["target_date"] <= first_of_current)].shape[0]
+    # Only include work orders due between first_of_previous (exclusive) and first_of_current (inclusive);
+    # the count is a sum over the numpy mask, so no filtered frame is built just to be measured
+    target_dates = df["target_date"].to_numpy()
+    due_for_month = int(((target_dates > first_of_previous.to_datetime64()) &
+                         (target_dates <= first_of_current.to_datetime64())).sum())
 
     return {
         "total_orders": len(df),
@@ -51,7 +57,7 @@ def generate_summary(df):
         "due_for_month": due_for_month
     }
 
-def run_analysis(filepath="data/processed/cleaned_work_orders.csv", dry_run=False):
+def run_analysis(filepath="data/processed/cleaned_work_orders.parquet", dry_run=False):
     df = load_cleaned_data(filepath)
     summary = generate_summary(df)
     if dry_run:
@@ -73,7 +79,7 @@ if __name__ == "__main__":
     args = parser.parse_args()  # ← needs to come before you use args
 
     if args.mode == "summary":
-        metrics = run_analysis(filepath="data/processed/cleaned_work_orders.csv", dry_run=args.dry_run)
+        metrics = run_analysis(filepath="data/processed/cleaned_work_orders.parquet", dry_run=args.dry_run)
         # Later: export_summary(metrics, output_path)
         for k, v in metrics.items():
             print(f"{k}: {v}")
@@ -7,7 +7,7 @@
 #
 # Requirements:
 #   - Input: pandas DataFrame (by_month_df) with columns: 'report_month', 'missed', 'completed', 'generated'.
-#   - Libraries: pandas, xlsxwriter, pptx.
+#   - Libraries: xlsxwriter, pptx.
 #   - Output paths: Excel file for chart data and image, PowerPoint file for slides.
 #
 # Output:
@@ -17,13 +17,33 @@
 # Notes:
 #   - Used by reporting modules to visualize monthly preventive maintenance metrics.
 #   - Functions: export_chart_to_excel (Excel chart), create_missed_by_month_slide (PowerPoint slide).
+#   - The "Title Only" layout is looked up once per Presentation and reused for later slides.
+#   - Chart data is streamed row by row in xlsxwriter's constant_memory mode, like the summary reports.
 # ---------------------------------------------------------------
 
 # scripts/chart_builder.py
 
 from pptx.util import Inches
-import pandas as pd
 import os
+import weakref
+import xlsxwriter
+from scripts.summary_generator import EXCEL_WRITE_OPTIONS, write_sheet_rows
+
+TITLE_ONLY_LAYOUT_INDEX = 5
+
+# Keyed by the presentation's package part (Presentation itself is unhashable).
+# Values are weak too, since a layout refers back to its package; that way an
+# entry disappears with its deck and repeated runs don't accumulate layouts
+title_only_layouts = weakref.WeakKeyDictionary()
+
+def title_only_layout(prs):
+    """Returns prs's "Title Only" slide layout, walking the slide master only on first use."""
+    layout_ref = title_only_layouts.get(prs.part)
+    layout = layout_ref() if layout_ref is not None else None
+    if layout is None:
+        layout = prs.slide_layouts[TITLE_ONLY_LAYOUT_INDEX]
+        title_only_layouts[prs.part] = weakref.ref(layout)
+    return layout
 
 def export_chart_to_excel(by_month_df, filename="outputs/reports/pm_chart.xlsx"):
     """
@@ -34,10 +54,9 @@ def export_chart_to_excel(by_month_df, filename="outputs/reports/pm_chart.xlsx")
     """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-    with pd.ExcelWriter(filename, engine="xlsxwriter") as writer:
-        by_month_df.to_excel(writer, index=False, sheet_name="ChartData")
-        workbook = writer.book
-        worksheet = writer.sheets["ChartData"]
+    with xlsxwriter.Workbook(filename, EXCEL_WRITE_OPTIONS) as workbook:
+        write_sheet_rows(workbook, "ChartData", by_month_df)
+        worksheet = workbook.get_worksheet_by_name("ChartData")
 
         chart = workbook.add_chart({'type': 'column'})
 
@@ -80,8 +99,7 @@ def export_chart_to_excel(by_month_df, filename="outputs/reports/pm_chart.xlsx")
     print(f"📊 Excel chart exported to: {filename}")
 
 def create_missed_by_month_slide(prs):
-    slide_layout = prs.slide_layouts[5]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(title_only_layout(prs))
     slide.shapes.title.text = "Preventive Maintenance Trends"
 
     img_path = "outputs/reports/pm_chart.png"
@@ -21,8 +21,10 @@
 
 # scripts/charts/group_missed_chart.py
 
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm  # Only if you’re using custom font files
+from config.settings import STOPLIGHT_COUNT_THRESHOLDS, STOPLIGHT_LABELS
 
 def build_group_missed_chart(data: dict, output_path: str) -> str:
     """
@@ -44,18 +46,14 @@ def build_group_missed_chart(data: dict, output_path: str) -> str:
     # Bar plot for missed
     ax1.bar(groups, missed, label="Missed", color="firebrick", alpha=0.7)
 
-    for i, val in enumerate(missed):
-        ax1.text(i, val + 1, str(val), ha="center", fontsize=10)
-
-    # Annotate stop light thresholds
-    for i, val in enumerate(missed):
-        if val <= 4:
-            label = "✅ Acceptable"
-        elif val <= 7:
-            label = "⚠️ Caution"
-        else:
-            label = "❌ Critical"
-        ax1.text(groups[i], val + 1, label, ha="center", fontsize=10)
+    # Format every count and stop light label up front, then annotate each bar in one pass.
+    # Stop light thresholds: <= 4 acceptable, <= 7 caution, otherwise critical
+    missed_values = np.asarray(missed)
+    count_labels = missed_values.astype(str)
+    labels = np.take(STOPLIGHT_LABELS, np.digitize(missed_values, STOPLIGHT_COUNT_THRESHOLDS, right=True))
+    for i, (x, val, count_label, label) in enumerate(zip(groups, missed, count_labels, labels)):
+        ax1.text(i, val + 1, count_label, ha="center", fontsize=10)
+        ax1.text(x, val + 1, label, ha="center", fontsize=10)
 
     # Labels, grid, legend
     ax1.set_title("Missed Work Orders by Group")
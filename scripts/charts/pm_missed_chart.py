@@ -17,11 +17,18 @@
 # Notes:
 #   - Used by reporting modules to visualize monthly PM work order metrics.
 #   - Function: build_pm_missed_chart(data, output_path)
+#   - Uses matplotlib's object API with the Agg canvas, so no GUI backend is loaded.
 # ---------------------------------------------------------------
 
 # scripts/charts/pm_missed_chart.py
 
-import matplotlib.pyplot as plt
+import numpy as np
+
+# Render with Agg directly; going through pyplot would start the default
+# interactive backend and register every figure with its global state
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from config.settings import STOPLIGHT_COUNT_THRESHOLDS, STOPLIGHT_LABELS
 
 def build_pm_missed_chart(data: dict, output_path: str) -> str:
     """
@@ -40,7 +47,9 @@ def build_pm_missed_chart(data: dict, output_path: str) -> str:
     complete = data["complete"]
     missed = data["missed"]
 
-    fig, ax1 = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax1 = fig.add_subplot()
 
     # Line plots
     ax1.plot(months, due, label="Due", marker="o", color="steelblue")
@@ -49,15 +58,10 @@ def build_pm_missed_chart(data: dict, output_path: str) -> str:
     # Bar plot for missed
     ax1.bar(months, missed, label="Missed", color="firebrick", alpha=0.7)
 
-    # Annotate stop light thresholds
-    for i, val in enumerate(missed):
-        if val <= 4:
-            label = "✅ Acceptable"
-        elif val <= 7:
-            label = "⚠️ Caution"
-        else:
-            label = "❌ Critical"
-        ax1.text(months[i], val + 1, label, ha="center", fontsize=10)
+    # Annotate stop light thresholds: <= 4 acceptable, <= 7 caution, otherwise critical
+    labels = np.take(STOPLIGHT_LABELS, np.digitize(missed, STOPLIGHT_COUNT_THRESHOLDS, right=True))
+    for x, val, label in zip(months, missed, labels):
+        ax1.text(x, val + 1, label, ha="center", fontsize=10)
 
     # Labels, grid, legend
     ax1.set_title("Preventive Maintenance Work Orders by Month")
@@ -65,8 +69,7 @@ def build_pm_missed_chart(data: dict, output_path: str) -> str:
     ax1.grid(True, linestyle="--", alpha=0.5)
     ax1.legend()
 
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close(fig)  # Close for memory efficiency
+    fig.tight_layout()
+    fig.savefig(output_path)  # no pyplot registry, so nothing to close
 
     return output_path
\ No newline at end of file
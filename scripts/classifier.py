@@ -6,7 +6,7 @@
 #
 # Requirements:
 #   - Input: pandas DataFrame with columns: 'status', 'target_date', 'actual_finish', 'grace_date'.
-#   - Libraries: pandas.
+#   - Libraries: pandas, numpy.
 #
 # Output:
 #   - Adds a 'wo_class' column to the DataFrame with values: 'canceled', 'open', 'on_time', or 'missed'.
@@ -14,33 +14,53 @@
 #
 # Notes:
 #   - Used by analysis and reporting modules to segment work orders for summary and charts.
-#   - Main functions: classify_work_order(row), apply_classification(df).
+#   - Main function: apply_classification(df), which evaluates the rules over whole
+#     columns at once with numpy.select instead of a per-row apply.
+#   - 'wo_class' is stored as a pandas categorical so downstream groupbys and
+#     comparisons work on integer codes; the loader does the same for status/group/type.
 # ---------------------------------------------------------------
 
 # scripts/classifier.py
 
+import numpy as np
 import pandas as pd
+from scripts.data_loader import as_datetime
 
-def classify_work_order(row):
-    status = str(row.get("status", "")).upper()
-    target_date = row.get("target_date")
-    finish_date = row.get("actual_finish")
-    grace_date = row.get("grace_date")
-
-    if status == "CAN":
-        return "canceled"
-    
-    if pd.isna(finish_date) or status not in ["COMP", "CORRECTED",
-                                              "CORRTD", "PENDQA", "PENRVW", "REVWD",
-                                              "CLOSE"]:
-        return "open"
-    elif finish_date <= grace_date:
-        return "on_time"
-    else:
-        return "missed"
+COMPLETED_STATUSES = frozenset({"COMP", "CORRECTED", "CORRTD", "PENDQA", "PENRVW", "REVWD", "CLOSE"})
+WO_CLASSES = ["canceled", "missed", "on_time", "open"]
+
+def status_flags(status):
+    """Returns (is_canceled, is_completed) boolean arrays for a status column."""
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        # Evaluate each distinct status once, then broadcast through the integer
+        # codes; the extra trailing False is picked up by code -1 (missing status)
+        upper = status.cat.categories.astype(str).str.upper()
+        codes = status.cat.codes.to_numpy()
+        is_canceled = np.append(upper == "CAN", False)[codes]
+        is_completed = np.append(upper.isin(COMPLETED_STATUSES), False)[codes]
+        return is_canceled, is_completed
+
+    upper = status.astype(str).str.upper()
+    return (upper == "CAN").to_numpy(), upper.isin(COMPLETED_STATUSES).to_numpy()
 
 def apply_classification(df):
-    df["wo_class"] = df.apply(classify_work_order, axis=1)    
+    """Adds the 'wo_class' column to df in place and returns the same DataFrame."""
+    is_canceled, is_completed = status_flags(df["status"])
+    finish_date = as_datetime(df["actual_finish"])
+    grace_date = as_datetime(df["grace_date"])
+
+    # Conditions are checked in order: canceled, then open (not finished or not
+    # in a completed status), then on time if finished by the grace date
+    wo_class = np.select(
+        [
+            is_canceled,
+            finish_date.isna().to_numpy() | ~is_completed,
+            (finish_date <= grace_date).to_numpy(),
+        ],
+        ["canceled", "open", "on_time"],
+        default="missed",
+    )
+    df["wo_class"] = pd.Categorical(wo_class, categories=WO_CLASSES)
     return df
 
 ##def classify_work_type(row):
@@ -8,43 +8,213 @@
 # Requirements:
 #   - Input: Excel (.xlsx) or CSV file containing raw work order data.
 #   - Config: COLUMN_MAP for column normalization, RAW_DATA_DIR for default paths.
-#   - Libraries: pandas, pathlib.
+#   - Libraries: pandas, pathlib; python-calamine (optional, faster Excel parsing).
 #
 # Output:
 #   - Returns a pandas DataFrame with normalized columns and converted date fields.
 #   - Adds a 'report_month' column as a pandas Period for monthly grouping.
+#   - 'status', 'group' and 'type' are returned as categorical columns.
 #
 # Notes:
 #   - Used by analysis and classification modules as the first step in the workflow.
 #   - Handles both Excel and CSV formats.
+#   - load_all_work_order_files reads every .xlsx in a directory on a thread pool.
+#   - Parsed .xlsx files are cached as Parquet in CACHE_DIR, keyed by CACHE_VERSION, path,
+#     mtime and size, so unchanged workbooks are not re-parsed; old entries are evicted LRU-style.
+#   - Excel files are parsed with the Rust-backed calamine engine when python-calamine
+#     is installed, falling back to a read-only openpyxl row reader otherwise.
+#   - as_datetime lets downstream modules skip re-parsing columns that are already datetime64.
 # ---------------------------------------------------------------
 
 # scripts/data_loader.py
 
+import os
+import hashlib
+from datetime import datetime
+from functools import reduce
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from config.settings import RAW_DATA_DIR, COLUMN_MAP
+from openpyxl import load_workbook
+from config.settings import RAW_DATA_DIR, COLUMN_MAP, CACHE_DIR, CACHE_MAX_FILES
+
+# Prefer calamine for .xlsx parsing; it is an order of magnitude faster than openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Only the columns used downstream are parsed; both raw and already-normalized
+# headers are accepted so previously cleaned files load the same way
+LOAD_COLUMNS = set(COLUMN_MAP) | set(COLUMN_MAP.values()) | {"work_order"}
+
+# Free-text columns are read as strings to skip pandas' type inference pass
+TEXT_COLUMNS = ["wo_description", "current_status", "work_type", "wo_assigned_group"]
+LOAD_DTYPES = {col: str for col in TEXT_COLUMNS + [COLUMN_MAP[c] for c in TEXT_COLUMNS]}
+
+DATE_COLUMNS = ["target_date", "actual_finish", "grace_date", "report_date"]
+
+# Work order identifiers; kept at a fixed width instead of being downcast
+ID_COLUMNS = ["work_order", "work_orders"]
+
+# Part of every cache key; bump it whenever COLUMN_MAP, LOAD_COLUMNS, LOAD_DTYPES or
+# the parsing below changes, so workbooks cached by an older loader are parsed again
+CACHE_VERSION = 2
+
+# Low-cardinality labels are stored as categoricals so comparisons and groupbys
+# run on small integer codes instead of Python strings
+CATEGORY_COLUMNS = ["status", "group", "type"]
+
+def read_excel_read_only(file_path):
+    """Reads the first sheet with openpyxl in read-only mode, keeping only LOAD_COLUMNS."""
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        keep = [i for i, col in enumerate(header) if col in LOAD_COLUMNS]
+        data = []
+        last_filled = 0
+        for row in rows:
+            # Only the kept cells are copied out of each row
+            data.append([row[i] for i in keep])
+            if any(cell is not None for cell in row):
+                last_filled = len(data)
+    finally:
+        workbook.close()
+
+    # Trailing blank rows are dropped, as read_excel does
+    df = pd.DataFrame(data[:last_filled], columns=[header[i] for i in keep])
+    for col in df.columns.intersection(list(LOAD_DTYPES)):
+        df[col] = df[col].map(str, na_action="ignore")
+    return df
+
+def parse_dates(values):
+    """Converts a column to datetime64, using pandas' ISO8601 parser when the text is ISO formatted."""
+    first_valid = values.first_valid_index()
+    if values.dtype == object and first_valid is not None and isinstance(values.loc[first_valid], str):
+        try:
+            datetime.fromisoformat(values.loc[first_valid])
+        except ValueError:
+            pass
+        else:
+            # ISO8601 skips per-file format inference and, unlike the single format
+            # inferred from the first value, accepts dates with and without times
+            return pd.to_datetime(values, format="ISO8601", errors="coerce", cache=True)
+    return pd.to_datetime(values, errors="coerce", cache=True)
+
+def as_datetime(values):
+    """Returns values unchanged when already datetime64, otherwise parses them with parse_dates."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return parse_dates(values)
+
+def cache_path_for(file_path):
+    """Returns the Parquet cache path for file_path; it changes whenever the file does."""
+    stat = os.stat(file_path)
+    key = f"{CACHE_VERSION}:{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return CACHE_DIR / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.parquet"
+
+def evict_cache(max_files=CACHE_MAX_FILES):
+    """Deletes the least recently used cache files beyond max_files."""
+    cached = []
+    for path in CACHE_DIR.glob("*.parquet"):
+        try:
+            cached.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue  # evicted by another loader thread since the glob
+    cached.sort(reverse=True)
+    for _, path in cached[max_files:]:
+        path.unlink(missing_ok=True)
 
 def load_work_order_files(file_path):
     """Loads a single file specified by file_path, normalizes columns, converts dates, and returns a clean DataFrame."""
+    if not file_path.endswith('.xlsx'):
+        return parse_work_order_file(file_path)
+
+    # Reading Parquet is far cheaper than re-parsing an unchanged workbook
+    cache_path = cache_path_for(file_path)
+    try:
+        os.utime(cache_path)  # mark as recently used for eviction
+        return pd.read_parquet(cache_path)
+    except FileNotFoundError:
+        pass  # not cached yet, or evicted by another loader thread
+
+    df = parse_work_order_file(file_path)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    df.to_parquet(tmp_path, compression="zstd", index=False)
+    tmp_path.replace(cache_path)
+    evict_cache()
+    return df
+
+def parse_work_order_file(file_path):
+    """Reads file_path without the cache, normalizes columns, converts dates, and returns a clean DataFrame."""
 
     # Load the file based on its extension
+    read_options = {"usecols": lambda col: col in LOAD_COLUMNS, "dtype": LOAD_DTYPES}
     if file_path.endswith('.xlsx'):
-        df = pd.read_excel(file_path, engine="openpyxl")
+        if EXCEL_ENGINE == "calamine":
+            df = pd.read_excel(file_path, engine=EXCEL_ENGINE, **read_options)
+        else:
+            df = read_excel_read_only(file_path)
     else:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, **read_options)
+
+    # Normalize column names in place to avoid a full copy of the raw frame
+    df.rename(columns=COLUMN_MAP, inplace=True)
 
-    # Normalize column names
-    df = df.rename(columns=COLUMN_MAP)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
-    # Convert date columns
-    for col in ["target_date", "actual_finish", "finish_no_later", "report_date"]:
+    # Convert date columns (names are post-rename, so grace_date is included)
+    for col in DATE_COLUMNS:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors="coerce")
+            df[col] = parse_dates(df[col])
+
+    # Identifiers read as float (because of blanks) become nullable Int64 when every
+    # value is whole, so each file gets the same exact type; otherwise they stay float64
+    id_columns = df.columns.intersection(ID_COLUMNS)
+    for col in id_columns:
+        if pd.api.types.is_float_dtype(df[col]):
+            values = df[col].dropna()
+            if (values == values.round()).all():
+                df[col] = df[col].astype("Int64")
+
+    # Downcast the other integer columns to the smallest type that holds every value.
+    # Floats are left alone: float32 is lossy, and whether to_numeric picks it would
+    # depend on each file's values
+    for col in df.select_dtypes(include="integer").columns.difference(id_columns):
+        df[col] = pd.to_numeric(df[col], downcast="integer")
 
     # Add report month column
     df["report_month"] = df["target_date"].dt.to_period("M")
 
     return df
 
+def load_all_work_order_files(data_dir=RAW_DATA_DIR):
+    """Loads every .xlsx file in data_dir in parallel and returns one combined DataFrame."""
+    all_files = sorted(str(path) for path in Path(data_dir).glob("*.xlsx"))
+    if not all_files:
+        raise FileNotFoundError(f"🚨 No .xlsx files found in: {data_dir}")
 
+    # Parsing is mostly C/Rust work, so threads overlap well without pickling frames
+    with ThreadPoolExecutor(max_workers=min(8, len(all_files))) as executor:
+        dfs = list(executor.map(load_work_order_files, all_files))
+
+    # Categories differ between files, and concat falls back to object strings when
+    # they do; recoding every file onto the sorted union keeps the codes instead
+    for col in CATEGORY_COLUMNS:
+        columns = [frame[col] for frame in dfs if col in frame.columns]
+        if len(columns) == len(dfs) and all(isinstance(c.dtype, pd.CategoricalDtype) for c in columns):
+            categories = reduce(pd.Index.union, (c.cat.categories for c in columns))
+            for frame, column in zip(dfs, columns):
+                frame[col] = column.cat.set_categories(categories)
+    df = pd.concat(dfs, ignore_index=True)
+
+    # Files where a column was not categorical still come back as object
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
@@ -1,72 +1,96 @@
+import logging
 import pandas as pd
 from scripts.data_loader import load_work_order_files
 from scripts.classifier import apply_classification
 from scripts.summary_generator import (
-    generate_monthly_summary,
+    format_monthly_summary,
     get_extreme_late_work_orders,
     export_summary_to_excel,
+    summarize_class_counts,
 )
-from scripts.summary_generator import generate_12_month_trend
+from config.settings import PROCESSED_PATH
+
+logger = logging.getLogger(__name__)
+
+# Disposition of a missed work order by its current status; any status not
+# listed here (FLAGGED, MISSED, WAPPR, APPR, INPRG, ...) is 'Awaiting Dept'
+DISPOSITION_MAP = {
+    "CLOSE": "Closed",
+    "REVWD": "Closed",
+    "PENRVW": "Closed",
+    "COMP": "Closed",
+    "CORRTD": "Closed",
+    "PENDQA": "Awaiting QA",
+}
+
+def save_processed_data(df, path=PROCESSED_PATH):
+    """Writes df to Parquet via a temp file so a crash never leaves a partial file behind."""
+    tmp_path = path.with_suffix(".tmp")
+    df.to_parquet(tmp_path, compression="zstd", index=False)
+    tmp_path.replace(path)
 
 def prepare_data(file_path):
     # Load and classify data
     print("prepare_data called with", file_path)
     print("Starting prepare_data")  # Debug print
-    df_cleaned = load_work_order_files(file_path)
-    print("Loaded raw data shape:", df_cleaned.shape)
-    df_classified = apply_classification(df_cleaned)
-    cleaned_path = "data/processed/cleaned_work_orders.csv"
-    df_classified.to_csv(cleaned_path, index=False)
+    df_classified = load_work_order_files(file_path)
+    print("Loaded raw data shape:", df_classified.shape)
+    # apply_classification adds columns in place, so no second copy of the raw frame is kept
+    df_classified = apply_classification(df_classified)
+    save_processed_data(df_classified)
 
-    # Ensure target_date is datetime
-    df_classified["target_date"] = pd.to_datetime(df_classified["target_date"], errors="coerce")
+    return build_report_data(df_classified)
 
-    # --- Build last 12 complete months using true date boundaries ---
-    trend_df = generate_12_month_trend(df_classified)
-    print("trend_df created")
-    print(trend_df)
-    print(trend_df["report_month"])
+def build_report_data(df_classified):
+    """
+    Builds the summary, group, trend, late, PM month, YTD and disposition tables
+    from an already classified DataFrame, so callers holding one skip the reload
+    """
+    # target_date is already parsed to datetime64 by load_work_order_files
 
     # --- Use only the previous month for group charts ---
     today = pd.Timestamp.today()
-    first_of_current = today.replace(day=1)
-    first_of_previous = (first_of_current - pd.DateOffset(months=1)).replace(day=1)
-    mask = (df_classified["target_date"] > first_of_previous) & (df_classified["target_date"] <= first_of_current)
-    df_prev_month = df_classified[mask]
 
-    by_group_df = (
-        df_prev_month
-        .groupby("group")
-        .agg(
-            missed=("wo_class", lambda x: (x == "missed").sum()),
-            completed=("wo_class", lambda x: (x == "on_time").sum()),
-            generated=("wo_class", "count"),
-            # FIX: Use consistent column name
-            missed_percentage=("wo_class", lambda x: 100 * (x == "missed").sum() / len(x) if len(x) else 0),
-            still_open=("wo_class", lambda x: (x == "open").sum())
-        )
-        .reset_index()
-    )
+    # Reporting months run from after the 1st through the 1st of the next month;
+    # shifting by 1ns before taking the Period keeps those boundaries
+    current_period = today.to_period("M")
+    report_period = (df_classified["target_date"] - pd.Timedelta(1, "ns")).dt.to_period("M")
 
-    # Build month boundaries
-    month_starts = [first_of_current - pd.DateOffset(months=i) for i in range(12, 0, -1)]
-    month_starts.append(first_of_current)
+    # Build last 12 months DataFrame, filtering once and keeping only the grouping
+    # columns rather than copying every column of the classified frame
+    mask = (report_period >= current_period - 12) & (report_period < current_period)
+    df_last_12 = df_classified.loc[mask, ["group", "wo_class"]].assign(report_month=report_period[mask])
 
-    # Build last 12 months DataFrame
-    month_dfs = []
-    for i in range(12):
-        start = month_starts[i]
-        end = month_starts[i+1]
-        mask = (df_classified["target_date"] > start) & (df_classified["target_date"] <= end)
-        month_df = df_classified[mask].copy()
-        month_df["report_month"] = start.strftime("%b-%y")
-        month_dfs.append(month_df)
-    df_last_12 = pd.concat(month_dfs, ignore_index=True)
+    # One month x group x class count feeds the trend, the monthly summary and the group charts
+    class_counts = (
+        df_last_12
+        .groupby(["report_month", "group", "wo_class"], observed=True, dropna=False)
+        .size()
+        .unstack("wo_class", fill_value=0)
+    )
+    monthly_counts = class_counts.groupby(level="report_month", observed=True).sum()
 
-    summary = generate_monthly_summary(df_last_12)
+    # --- Build last 12 complete months using true date boundaries ---
+    last_12_periods = pd.period_range(end=current_period - 1, periods=12, freq="M")
+    trend_df = (
+        summarize_class_counts(monthly_counts.reindex(last_12_periods, fill_value=0))
+        [["missed", "completed", "generated"]]
+    )
+    trend_df.insert(0, "report_month", last_12_periods.strftime("%b-%y"))
+    trend_df = trend_df.reset_index(drop=True)
+    print("trend_df created")
+    logger.debug("trend_df:\n%s", trend_df)
 
-    # FIX: Remove Grand Total from summary
-    summary = summary[summary["Month"] != "Grand Total"].copy()
+    prev_month_counts = class_counts[class_counts.index.get_level_values("report_month") == current_period - 1]
+    prev_month_counts = prev_month_counts.droplevel("report_month")
+    # FIX: Use consistent column name
+    by_group_df = (
+        summarize_class_counts(prev_month_counts[prev_month_counts.index.notna()], percent_column="missed_percentage")
+        .reset_index()
+    )
+
+    # FIX: Remove Grand Total from summary (by never building it)
+    summary = format_monthly_summary(monthly_counts, grand_total=False)
     
     # FIX: Generate disposition data
     disposition_df = generate_disposition_data(df_classified)
@@ -74,27 +98,16 @@ def prepare_data(file_path):
     late_df = get_extreme_late_work_orders(df_classified)
     # Add debugging:
     print(f"Late work orders found: {len(late_df)}")
-    print("Late work orders preview:")
-    print(late_df[['work_order', 'target_date', 'status', 'group']].head(15))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Late work orders preview:\n%s", late_df[['work_order', 'target_date', 'status', 'group']].head(15))
 
     # Now build PM Month and YTD after summary exists
-    pm_month_label = first_of_previous.strftime("%b-%y")
+    pm_month_label = (current_period - 1).strftime("%b-%y")
     pm_month_df = summary[summary["Month"] == pm_month_label]
 
-    current_year = today.year % 100
-    summary_with_year = summary.copy()
-    def safe_year_extract(month_str):
-        try:
-            if pd.isna(month_str) or len(str(month_str)) < 2:
-                return None
-            return int(str(month_str)[-2:])
-        except (ValueError, TypeError):
-            print(f"Warning: Could not extract year from '{month_str}'")
-            return None
-
-    summary_with_year["year"] = summary_with_year["Month"].apply(safe_year_extract)
-    summary_with_year = summary_with_year.dropna(subset=["year"])
-    ytd_df = summary_with_year[summary_with_year["year"] == current_year].drop(columns=["year"])
+    # Take each summary month's year from its Period instead of re-parsing the label
+    month_years = dict(zip(monthly_counts.index.strftime("%b-%y"), monthly_counts.index.year))
+    ytd_df = summary[summary["Month"].map(month_years) == today.year]
 
     return summary, by_group_df, trend_df, late_df, pm_month_df, ytd_df, df_classified, disposition_df 
 
@@ -102,13 +115,16 @@ def generate_disposition_data(df_classified):
     """
     Generate disposition data for missed work orders by month and current status
     """
-    print("🔍 DEBUG: Starting disposition data generation...")
+    # Diagnostics below scan whole columns, so they only run when debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    logger.debug("🔍 Starting disposition data generation...")
     
     # Filter to only missed work orders
-    missed_df = df_classified[df_classified["wo_class"] == "missed"].copy()
-    print(f"🔍 DEBUG: Found {len(missed_df)} missed work orders")
+    missed_mask = df_classified["wo_class"] == "missed"
+    if debug:
+        logger.debug(f"🔍 Found {missed_mask.sum()} missed work orders")
     
-    if missed_df.empty:
+    if not missed_mask.any():
         print("⚠️ No missed work orders found for disposition data")
         return pd.DataFrame()
     
@@ -117,74 +133,57 @@ def generate_disposition_data(df_classified):
     first_of_current = today.replace(day=1)
     
     # Build the same 12 months as trend_df
-    month_starts = []
-    for i in range(12, 0, -1):
-        month_start = first_of_current - pd.DateOffset(months=i)
-        month_starts.append(month_start)
+    month_index = pd.date_range(
+        start=first_of_current - pd.DateOffset(months=12), periods=12, freq=pd.DateOffset(months=1)
+    )
     
-    # Filter missed_df to the same 12-month period
-    start_date = month_starts[0]
+    # Filter to the same 12-month period in the same pass, keeping only the
+    # columns read below instead of copying every column of the frame
+    start_date = month_index[0]
     end_date = first_of_current
-    missed_df = missed_df[
-        (missed_df['target_date'] >= start_date) & 
-        (missed_df['target_date'] < end_date)
-    ].copy()
+    target_date = df_classified['target_date']
+    missed_mask &= (target_date >= start_date) & (target_date < end_date)
+    missed_df = df_classified.loc[missed_mask, ['target_date', 'status']]
     
-    print(f"🔍 DEBUG: After date filter ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}): {len(missed_df)} missed work orders")
+    logger.debug(f"🔍 After date filter ({start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}): {len(missed_df)} missed work orders")
     
     if missed_df.empty:
         print("⚠️ No missed work orders in the 12-month period")
         return pd.DataFrame()
     
     # Group current status into disposition categories
-    def categorize_status(status):
-        closed_statuses = ['CLOSE', 'REVWD', 'PENRVW', 'COMP', 'CORRTD']
-        qa_statuses = ['PENDQA']
-        dept_statuses = ['FLAGGED', 'MISSED', 'WAPPR', 'APPR', 'INPRG']
-        
-        if status in closed_statuses:
-            return 'Closed'
-        elif status in qa_statuses:
-            return 'Awaiting QA'
-        elif status in dept_statuses:
-            return 'Awaiting Dept'
-        else:
-            return 'Awaiting Dept'  # Default
-    
-    missed_df['disposition'] = missed_df['status'].apply(categorize_status)
+    missed_df['disposition'] = missed_df['status'].map(DISPOSITION_MAP).astype(object).fillna('Awaiting Dept')
     
     # Debug: Show status distribution
-    print("🔍 DEBUG: Status distribution:")
-    print(missed_df['status'].value_counts())
-    print("🔍 DEBUG: Disposition distribution:")
-    print(missed_df['disposition'].value_counts())
+    if debug:
+        logger.debug("🔍 Status distribution:\n%s", missed_df['status'].value_counts())
+        logger.debug("🔍 Disposition distribution:\n%s", missed_df['disposition'].value_counts())
     
     # FIX: Create report_month column using the same logic as trend generation
-    def assign_report_month(target_date):
-        for i, month_start in enumerate(month_starts):
-            month_end = month_start + pd.DateOffset(months=1)
-            if month_start <= target_date < month_end:
-                return month_start.strftime("%b-%y")
-        return None
-    
-    missed_df['report_month'] = missed_df['target_date'].apply(assign_report_month)
+    # Each date falls in the last month that starts on or before it; one
+    # searchsorted over the sorted month starts replaces the per-row loop
+    month_labels = pd.Series(month_index.strftime("%b-%y"))
+    month_pos = month_index.searchsorted(missed_df['target_date'], side="right") - 1
+    missed_df['report_month'] = month_labels.reindex(month_pos).to_numpy()
     
     # Remove rows where report_month is None
     missed_df = missed_df.dropna(subset=['report_month'])
     
-    print(f"🔍 DEBUG: After report_month assignment: {len(missed_df)} missed work orders")
-    print(f"🔍 DEBUG: Report months found: {sorted(missed_df['report_month'].unique())}")
+    if debug:
+        logger.debug(f"🔍 After report_month assignment: {len(missed_df)} missed work orders")
+        logger.debug(f"🔍 Report months found: {sorted(missed_df['report_month'].unique())}")
     
     # Group by month and disposition
     disposition_summary = (
-        missed_df.groupby(['report_month', 'disposition'])
+        missed_df.groupby(['report_month', 'disposition'], observed=True)
         .size()
         .unstack(fill_value=0)
         .reset_index()
     )
     
-    print(f"🔍 DEBUG: disposition_summary shape: {disposition_summary.shape}")
-    print(f"🔍 DEBUG: disposition_summary columns: {disposition_summary.columns.tolist()}")
+    if debug:
+        logger.debug(f"🔍 disposition_summary shape: {disposition_summary.shape}")
+        logger.debug(f"🔍 disposition_summary columns: {disposition_summary.columns.tolist()}")
     
     # Ensure all columns exist
     for col in ['Closed', 'Awaiting QA', 'Awaiting Dept']:
@@ -199,7 +198,6 @@ def generate_disposition_data(df_classified):
     })
     
     print(f"📊 Disposition data generated with {len(disposition_summary)} months")
-    print(f"🔍 DEBUG: Final disposition_summary:")
-    print(disposition_summary)
+    logger.debug("🔍 Final disposition_summary:\n%s", disposition_summary)
     
     return disposition_summary
\ No newline at end of file
@@ -2,7 +2,8 @@
 
 import pandas as pd
 import os
-from config import REPORT_DIR
+from openpyxl import Workbook
+from config.settings import REPORT_DIR
 
 def print_centered_summary(df):
     columns = ["   Month", "Due", "Completed", "Missed", "Open", "Canceled", "Completion %"]
@@ -13,20 +14,30 @@ def print_centered_summary(df):
     print(header)
     print("-" * len(header))
 
-    for _, row in df.iterrows():
-        row_values = [
-            str(row["Month"]),
-            str(row["Due"]),
-            str(row["Completed"]),
-            str(row["Missed"]),
-            str(row["Still Open"]),
-            str(row["Canceled"]),
-            f"{row['Completion %']:.2f}%"
-        ]
-        print(" | ".join(f"{val:^{w}}" for val, w in zip(row_values, widths)))
+    # Format each column once, then join rows from plain tuples (no per-row Series)
+    cells = df[["Month", "Due", "Completed", "Missed", "Still Open", "Canceled"]].astype(str)
+    cells["Completion %"] = df["Completion %"].map("{:.2f}%".format)
+    lines = [
+        " | ".join(f"{val:^{w}}" for val, w in zip(row_values, widths))
+        for row_values in cells.itertuples(index=False, name=None)
+    ]
+    if lines:
+        print("\n".join(lines))
+
+def append_sheet_rows(workbook, sheet_name, df):
+    worksheet = workbook.create_sheet(sheet_name)
+    worksheet.append([str(col) for col in df.columns])
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        worksheet.append(row)
 
 def export_summary_to_excel(summary_df, late_df, filename="monthly_summary.xlsx"):
         filepath = os.path.join(REPORT_DIR, filename)
-        with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-            summary_df.to_excel(writer, sheet_name="Monthly Summary", index=False)
+
+        # write_only streams rows straight to XML instead of keeping styled Cell objects
+        workbook = Workbook(write_only=True)
+        append_sheet_rows(workbook, "Monthly Summary", summary_df)
+        if late_df is not None:
+            append_sheet_rows(workbook, "Late >90 Days", late_df)
+        workbook.save(filepath)
         print(f"✅ Exported summary and late WOs to Excel: {filepath}")
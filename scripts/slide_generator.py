@@ -17,21 +17,128 @@
 #   - Functions are provided for both creating new slides and updating existing charts/tables.
 #   - All chart and table updates require matching shape/chart names in the PowerPoint template.
 #   - Designed for use in both CLI and GUI workflows.
+#   - The template file is read from disk once per process (until it changes) and
+#     each deck is opened from those bytes in memory.
+#   - Finished decks are built in memory and written to disk in a single write.
+#   - Diagnostic dumps (frame heads, column lists, chart values) go to the module
+#     logger at DEBUG level and are skipped entirely otherwise.
+#   - pptx.chart.data is imported inside the chart updaters, so importing this
+#     module for the template or summary helpers doesn't load it.
 # ---------------------------------------------------------------
 
 # scripts/slide_generator.py
 
 import os
+import io
+import functools
+import logging
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 from pptx.enum.chart import XL_CHART_TYPE
-from pptx.chart.data import CategoryChartData
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import traceback
+from config.settings import STOPLIGHT_PERCENT_THRESHOLDS
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_PATH = "data/templates/governance_slide_template.pptx"
+
+# Fixed layout and style values, built once instead of on every slide update
+TITLE_AREA_BOTTOM = Inches(1.5)
+TITLE_FONT_SIZE = Pt(32)
+SUMMARY_FONT_SIZE = Pt(18)
+TITLE_COLOR = RGBColor(0, 76, 153)  # Blue
+SUMMARY_TEXT_COLOR = RGBColor(0, 102, 51)  # Greenish
+WHITE = RGBColor(255, 255, 255)
+LIGHT_BLUE = RGBColor(51, 153, 255)
+MONTH_FONT_SIZE = Pt(13)
+STOPLIGHT_FONT_SIZE = Pt(16)
+STOPLIGHT_RED = RGBColor(102, 0, 0)
+STOPLIGHT_YELLOW = RGBColor(204, 204, 0)
+STOPLIGHT_GREEN = RGBColor(0, 204, 0)
+TEXT_BOX_FONT_SIZE = Pt(16)
+
+# Stoplight (emoji, fill) by level: GREEN <=3%, YELLOW >3% <=6%, RED >6% missed.
+# classify_stoplights maps missed percentages to these levels using
+# STOPLIGHT_PERCENT_THRESHOLDS from config.settings
+STOPLIGHTS = (
+    ("🟢", STOPLIGHT_GREEN),
+    ("🟡", STOPLIGHT_YELLOW),
+    ("🔴", STOPLIGHT_RED),
+)
+
+# Disposition chart series in stacking order: (series name, disposition_df key, fill color)
+DISPOSITION_SERIES = (
+    ('Closed', 'closed', RGBColor.from_string('28A745')),              # Green
+    ('Awaiting QA', 'awaiting_qa', RGBColor.from_string('FFC107')),    # Yellow
+    ('Awaiting Dept', 'awaiting_dept', RGBColor.from_string('DC3545')), # Red
+)
+
+# by_month_df count columns that are totalled for the summary text
+TOTAL_COLUMNS = ['generated', 'completed', 'missed']
+SUMMARY_COUNT_LABELS = ('Generated', 'Completed', 'Missed')
+
+# Text that marks the summary slide's content boxes (below the title area)
+MONTHLY_SUMMARY_KEYWORDS = ("Monthly Summary", "Previous Month", "Month Summary")
+YTD_SUMMARY_KEYWORDS = ("YTD Summary", "Year to Date")
+
+# Accepted by_month_df column names for each missed by month chart value
+MONTH_COLUMN_CANDIDATES = {
+    'generated': ('Due', 'generated', 'Generated'),
+    'completed': ('Completed', 'completed'),
+    'missed': ('Missed', 'missed'),
+}
+
+# Accepted by_group_df column names for each group chart value
+GROUP_COLUMN_CANDIDATES = {
+    'group': ('group', 'Group', 'GROUP'),
+    'missed': ('missed', 'Missed', 'MISSED'),
+    'missed_percentage': ('missed_percentage', 'Missed %', 'missed_pct', 'Miss %'),
+    'still_open': ('still_open', 'Still Open', 'Open', 'OPEN'),
+}
+
+# Titles of the template charts that update_group_charts fills
+GROUP_CHART_TITLES = frozenset({
+    "Qty Missed by Group",
+    "% Missed by Group",
+    "Missed Still Open by Group",
+})
+
+@functools.lru_cache(maxsize=4)
+def read_template_bytes(template_path, mtime):
+    """Reads the template file once per (path, mtime); mtime is only part of the cache key."""
+    with open(template_path, "rb") as f:
+        return f.read()
+
+def load_template(template_path=TEMPLATE_PATH):
+    """Returns a fresh, independently editable Presentation built from the cached template bytes."""
+    template_bytes = read_template_bytes(template_path, os.path.getmtime(template_path))
+    return Presentation(io.BytesIO(template_bytes))
+
+def set_paragraph_font(paragraph, size, bold=True, color=None, name=None):
+    """Styles a paragraph through a single Font proxy instead of re-reading paragraph.font per attribute."""
+    # Each paragraph.font access looks up (or creates) the paragraph's run properties again
+    font = paragraph.font
+    if name is not None:
+        font.name = name
+    font.size = size
+    font.bold = bold
+    if color is not None:
+        font.color.rgb = color
+
+def save_presentation(prs, output_path):
+    """Saves prs by building the whole .pptx in memory and writing it to disk in one call."""
+    # python-pptx writes each zip member with many small writes; on a network share
+    # those round trips dominate, so collect them in memory first
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(buffer.getbuffer())
 
 def create_full_governance_deck(by_month_df, late_df, disposition_df, by_group_df, filename=None):
     """
@@ -46,8 +153,8 @@ def create_full_governance_deck(by_month_df, late_df, disposition_df, by_group_d
     """
     try:
         # FIX: Correct template filename
-        template_path = "data/templates/governance_slide_template.pptx"
-        prs = Presentation(template_path)
+        template_path = TEMPLATE_PATH
+        prs = load_template(template_path)
         print(f"✅ Loaded template: {template_path}")
         
         # Generate filename if not provided
@@ -56,17 +163,20 @@ def create_full_governance_deck(by_month_df, late_df, disposition_df, by_group_d
             filename = f"governance_slide_{current_month}.pptx"
             print(f"🔍 DEBUG: Auto-generated PowerPoint filename: {filename}")
         
+        # Build the slide objects once and hand each updater the slide it works on
+        slides = list(prs.slides)
+        
         # FIX: Add slide 0 processing for monthly and YTD summaries
-        update_summary_slide(prs, by_month_df, late_df, slide_index=0)
+        update_summary_slide(slides[0], by_month_df, late_df)
         
         # Update all slides with data
-        update_missed_by_month_chart(prs, by_month_df, slide_index=1)
-        update_missed_disposition_chart(prs, disposition_df, slide_index=2)
-        update_group_charts(prs, by_group_df, slide_index=3)
+        update_missed_by_month_chart(slides[1], by_month_df)
+        update_missed_disposition_chart(slides[2], disposition_df)
+        update_group_charts(slides, by_group_df)
         
         # Save the presentation
         output_path = f"outputs/presentations/{filename}"
-        prs.save(output_path)
+        save_presentation(prs, output_path)
         print(f"✅ Full governance deck saved to: {output_path}")
         
         return output_path
@@ -76,99 +186,98 @@ def create_full_governance_deck(by_month_df, late_df, disposition_df, by_group_d
         traceback.print_exc()
         return None
 
-def update_summary_slide(prs, by_month_df, late_df, slide_index=0):
+def update_summary_slide(slide, by_month_df, late_df):
     """
     Updates slide 0 with monthly summary and YTD summary
     """
     try:
-        slide = prs.slides[slide_index]
-        
         # Calculate current month and YTD data
         today = datetime.now()
         current_month = today.strftime("%b-%y")
         current_year = today.year % 100  # Get 2-digit year
         
         # Monthly Summary (Previous Month)
-        prev_month = (today.replace(day=1) - pd.DateOffset(months=1)).strftime("%b-%y")
-        monthly_data = by_month_df[by_month_df['report_month'] == prev_month]
+        prev_month = (pd.Period(today, freq="M") - 1).strftime("%b-%y")
+        
+        # Pull the count columns out once for both the monthly row and the YTD sum,
+        # and find the month by position in the label list instead of a boolean mask
+        totals = by_month_df[TOTAL_COLUMNS].to_numpy()
+        month_labels = by_month_df['report_month'].tolist()
         
-        if not monthly_data.empty:
-            monthly_generated = monthly_data['generated'].iloc[0]
-            monthly_completed = monthly_data['completed'].iloc[0]
-            monthly_missed = monthly_data['missed'].iloc[0]
+        if prev_month in month_labels:
+            # Read the month's counts as plain scalars from one numpy row
+            monthly_generated, monthly_completed, monthly_missed = totals[month_labels.index(prev_month)]
             monthly_completion_rate = (monthly_completed / monthly_generated * 100) if monthly_generated > 0 else 0
         else:
             monthly_generated = monthly_completed = monthly_missed = 0
             monthly_completion_rate = 0
         
         # YTD Summary (Current Year)
-        ytd_data = by_month_df[by_month_df['report_month'].str.endswith(f'-{current_year:02d}')]
-        ytd_generated = ytd_data['generated'].sum()
-        ytd_completed = ytd_data['completed'].sum()
-        ytd_missed = ytd_data['missed'].sum()
+        # Parse the label list pulled above once and sum the count columns in a
+        # single numpy reduction, without materializing an intermediate YTD frame
+        month_years = pd.to_datetime(month_labels, format='%b-%y', errors='coerce', cache=True).year
+        ytd_mask = month_years == today.year
+        ytd_generated, ytd_completed, ytd_missed = totals[ytd_mask].sum(axis=0)
         ytd_completion_rate = (ytd_completed / ytd_generated * 100) if ytd_generated > 0 else 0
         
         # Count late work orders for summary
         late_count = len(late_df) if late_df is not None and not late_df.empty else 0
         
-        # FIX: Ensure the title is preserved
-        # First, find and preserve the title
-        title_shape = None
+        # Format the summary text once; it is reused whether a template box is
+        # updated or a new box has to be created
+        monthly_text = format_summary_text(
+            f"Monthly Summary ({prev_month})",
+            (monthly_generated, monthly_completed, monthly_missed), monthly_completion_rate)
+        ytd_text = format_summary_text(
+            f"YTD Summary (20{current_year})",
+            (ytd_generated, ytd_completed, ytd_missed), ytd_completion_rate)
+        
+        # Classify every text box in one pass over the shape tree, reading each
+        # box's text and top once. The title sits above TITLE_AREA_BOTTOM and the
+        # content boxes below it, so one box can never be both
+        title_shape = monthly_shape = ytd_shape = None
         for shape in slide.shapes:
-            if hasattr(shape, "text_frame") and shape.text_frame:
-                text_content = shape.text_frame.text
+            if not shape.has_text_frame:
+                continue
+            text_content = shape.text_frame.text
+            shape_top = shape.top
+            if shape_top < TITLE_AREA_BOTTOM:
                 # Check if this is likely the title (position and content)
-                if (hasattr(shape, 'top') and shape.top < Inches(1.5) and 
-                    ("PM Monthly" in text_content or "Summary" in text_content or 
-                     "YTD" in text_content and len(text_content) < 100)):
+                if title_shape is None and (
+                        "PM Monthly" in text_content or "Summary" in text_content or
+                        "YTD" in text_content and len(text_content) < 100):
                     title_shape = shape
-                    # Set the correct title
-                    title_shape.text_frame.clear()
-                    p = title_shape.text_frame.paragraphs[0]
-                    p.text = "PM Monthly and YTD and Summaries Completion Rates"
-                    p.font.name = 'Aptos'
-                    p.font.size = Pt(32)
-                    p.font.bold = True
-                    p.font.color.rgb = RGBColor(0, 76, 153)  # Blue color
-                    print("✅ Updated slide title")
-                    break
-        
-        # Find and update content text boxes (excluding title)
-        monthly_updated = False
-        ytd_updated = False
+            elif shape_top > TITLE_AREA_BOTTOM:
+                if monthly_shape is None and any(k in text_content for k in MONTHLY_SUMMARY_KEYWORDS):
+                    monthly_shape = shape
+                elif ytd_shape is None and any(k in text_content for k in YTD_SUMMARY_KEYWORDS):
+                    ytd_shape = shape
         
-        for shape in slide.shapes:
-            if hasattr(shape, "text_frame") and shape.text_frame and shape != title_shape:
-                text_content = shape.text_frame.text
-                
-                # Monthly Summary Text Box (not in title area)
-                if (("Monthly Summary" in text_content or "Previous Month" in text_content or 
-                     "Month Summary" in text_content) and 
-                    hasattr(shape, 'top') and shape.top > Inches(1.5) and not monthly_updated):
-                    new_text = f"Monthly Summary ({prev_month}):\nGenerated: {monthly_generated:,}\nCompleted: {monthly_completed:,}\nMissed: {monthly_missed:,}\nCompletion Rate: {monthly_completion_rate:.1f}%"
-                    shape.text_frame.clear()
-                    p = shape.text_frame.paragraphs[0]
-                    p.text = new_text
-                    p.font.name = 'Aptos'
-                    p.font.size = Pt(18)
-                    p.font.bold = True
-                    p.font.color.rgb = RGBColor(0, 102, 51)  # Greenish color
-                    monthly_updated = True
-                    print(f"✅ Updated Monthly Summary for {prev_month}")
-                
-                # YTD Summary Text Box (not in title area)
-                elif (("YTD Summary" in text_content or "Year to Date" in text_content) and 
-                      hasattr(shape, 'top') and shape.top > Inches(1.5) and not ytd_updated):
-                    new_text = f"YTD Summary (20{current_year}):\nGenerated: {ytd_generated:,}\nCompleted: {ytd_completed:,}\nMissed: {ytd_missed:,}\nCompletion Rate: {ytd_completion_rate:.1f}%"
-                    shape.text_frame.clear()
-                    p = shape.text_frame.paragraphs[0]
-                    p.text = new_text
-                    p.font.name = 'Aptos'
-                    p.font.size = Pt(18)
-                    p.font.bold = True
-                    p.font.color.rgb = RGBColor(0, 102, 51)  # Greenish color
-                    ytd_updated = True
-                    print(f"✅ Updated YTD Summary for 20{current_year}")
+        # FIX: Ensure the title is preserved
+        if title_shape is not None:
+            title_shape.text_frame.clear()
+            p = title_shape.text_frame.paragraphs[0]
+            p.text = "PM Monthly and YTD and Summaries Completion Rates"
+            set_paragraph_font(p, TITLE_FONT_SIZE, color=TITLE_COLOR, name='Aptos')
+            print("✅ Updated slide title")
+        
+        # Update the content text boxes found in the template
+        monthly_updated = monthly_shape is not None
+        ytd_updated = ytd_shape is not None
+        
+        if monthly_updated:
+            monthly_shape.text_frame.clear()
+            p = monthly_shape.text_frame.paragraphs[0]
+            p.text = monthly_text
+            set_paragraph_font(p, SUMMARY_FONT_SIZE, color=SUMMARY_TEXT_COLOR, name='Aptos')
+            print(f"✅ Updated Monthly Summary for {prev_month}")
+        
+        if ytd_updated:
+            ytd_shape.text_frame.clear()
+            p = ytd_shape.text_frame.paragraphs[0]
+            p.text = ytd_text
+            set_paragraph_font(p, SUMMARY_FONT_SIZE, color=SUMMARY_TEXT_COLOR, name='Aptos')
+            print(f"✅ Updated YTD Summary for 20{current_year}")
         
         # If no existing content text boxes found, create them
         if not monthly_updated:
@@ -179,9 +288,8 @@ def update_summary_slide(prs, by_month_df, late_df, slide_index=0):
             height = Inches(3.5)
             textbox = slide.shapes.add_textbox(left, top, width, height)
             text_frame = textbox.text_frame
-            text_frame.text = f"Monthly Summary ({prev_month}):\nGenerated: {monthly_generated:,}\nCompleted: {monthly_completed:,}\nMissed: {monthly_missed:,}\nCompletion Rate: {monthly_completion_rate:.1f}%"
-            text_frame.paragraphs[0].font.size = Pt(16)
-            text_frame.paragraphs[0].font.bold = True
+            text_frame.text = monthly_text
+            set_paragraph_font(text_frame.paragraphs[0], TEXT_BOX_FONT_SIZE)
             print(f"📝 Created new Monthly Summary text box for {prev_month}")
         
         if not ytd_updated:
@@ -192,9 +300,8 @@ def update_summary_slide(prs, by_month_df, late_df, slide_index=0):
             height = Inches(3.5)
             textbox = slide.shapes.add_textbox(left, top, width, height)
             text_frame = textbox.text_frame
-            text_frame.text = f"YTD Summary (20{current_year}):\nGenerated: {ytd_generated:,}\nCompleted: {ytd_completed:,}\nMissed: {ytd_missed:,}\nCompletion Rate: {ytd_completion_rate:.1f}%\nLate Orders: {late_count:,}"
-            text_frame.paragraphs[0].font.size = Pt(16)
-            text_frame.paragraphs[0].font.bold = True
+            text_frame.text = f"{ytd_text}\nLate Orders: {late_count:,}"
+            set_paragraph_font(text_frame.paragraphs[0], TEXT_BOX_FONT_SIZE)
             print(f"📝 Created new YTD Summary text box for 20{current_year}")
         
         print("✅ Summary slide (slide 0) updated successfully")
@@ -203,17 +310,55 @@ def update_summary_slide(prs, by_month_df, late_df, slide_index=0):
         print(f"❌ Error updating summary slide: {e}")
         traceback.print_exc()
 
-def update_missed_by_month_chart(prs, by_month_df, slide_index=1):
+def format_summary_text(heading, counts, completion_rate):
     """
-    Updates the missed by month chart on slide 1 and adds stoplight table
+    Builds a summary text box: the heading, one line per TOTAL_COLUMNS count
+    (generated, completed, missed) and the completion rate
+    """
+    lines = [f"{heading}:"]
+    lines.extend(f"{label}: {count:,}" for label, count in zip(SUMMARY_COUNT_LABELS, counts))
+    lines.append(f"Completion Rate: {completion_rate:.1f}%")
+    return "\n".join(lines)
+
+def resolve_columns(df, candidates):
+    """
+    Maps each standard name in candidates to the first of its accepted column
+    names present in df; names with no matching column are left out
     """
-    slide = prs.slides[slide_index]
+    present = set(df.columns)
+    actual_columns = {}
+    for standard_name, possible_names in candidates.items():
+        found = next((name for name in possible_names if name in present), None)
+        if found is not None:
+            actual_columns[standard_name] = found
+    return actual_columns
+
+def build_month_chart_data(by_month_df, month_labels, actual_columns):
+    """Builds the Missed/Completed/Generated chart data for the missed by month chart."""
+    from pptx.chart.data import CategoryChartData  # chart-only, loaded on first use
+    chart_data = CategoryChartData()
+    
+    # Use the identified month column's labels as categories
+    chart_data.categories = month_labels
     
+    # Add data series using mapped column names
+    # FIX: Correct order - Generated, Missed, Completed
+    # Pull all three series out as one numpy block; column slices are views
+    series_names = ('Missed', 'Completed', 'Generated')
+    values = by_month_df[[actual_columns[name.lower()] for name in series_names]].to_numpy()
+    for i, name in enumerate(series_names):
+        chart_data.add_series(name, values[:, i].tolist())
+    return chart_data
+
+def update_missed_by_month_chart(slide, by_month_df):
+    """
+    Updates the missed by month chart on slide 1 and adds stoplight table
+    """
     # Debug: Print DataFrame info
-    print("🔍 DEBUG: by_month_df columns:", by_month_df.columns.tolist())
-    print("🔍 DEBUG: by_month_df shape:", by_month_df.shape)
-    print("🔍 DEBUG: by_month_df head:")
-    print(by_month_df.head())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"🔍 by_month_df columns: {by_month_df.columns.tolist()}")
+        logger.debug(f"🔍 by_month_df shape: {by_month_df.shape}")
+        logger.debug("🔍 by_month_df head:\n%s", by_month_df.head())
     
     # Find and update the chart
     chart_found = False
@@ -237,99 +382,84 @@ def update_missed_by_month_chart(prs, by_month_df, slide_index=1):
             print("❌ Could not find month column in DataFrame")
             return
     
-    # Map column names to standardized names
-    column_mapping = {
-        'generated': ['Due', 'generated', 'Generated'],
-        'completed': ['Completed', 'completed'], 
-        'missed': ['Missed', 'missed']
-    }
-    
     # Find the actual column names
-    actual_columns = {}
-    for standard_name, possible_names in column_mapping.items():
-        for possible_name in possible_names:
-            if possible_name in by_month_df.columns:
-                actual_columns[standard_name] = possible_name
-                break
-        if standard_name not in actual_columns:
-            print(f"❌ Could not find column for '{standard_name}' in DataFrame")
-            return
+    actual_columns = resolve_columns(by_month_df, MONTH_COLUMN_CANDIDATES)
+    missing = [name for name in MONTH_COLUMN_CANDIDATES if name not in actual_columns]
+    if missing:
+        print(f"❌ Could not find column for '{missing[0]}' in DataFrame")
+        return
     
     print(f"📅 Using month column: '{month_column}'")
     print(f"📊 Column mapping: {actual_columns}")
     
+    # Convert the month labels once for both the chart categories and the stoplight table
+    month_labels = by_month_df[month_column].astype(str).to_numpy().tolist()
+    
+    # Find the chart and the rolling totals text box in one walk over the shapes
+    chart_shape = totals_shape = None
     for shape in slide.shapes:
-        # Update chart with new data
-        if hasattr(shape, "chart"):
-            chart = shape.chart
-            chart_data = CategoryChartData()
-            
-            # Use identified month column as categories
-            categories = by_month_df[month_column].astype(str).tolist()
-            chart_data.categories = categories
-            
-            # Add data series using mapped column names
-            # FIX: Correct order - Generated, Missed, Completed
-            chart_data.add_series('Missed', by_month_df[actual_columns['missed']].tolist())
-            chart_data.add_series('Completed', by_month_df[actual_columns['completed']].tolist())
-            chart_data.add_series('Generated', by_month_df[actual_columns['generated']].tolist())
-            
-            # Replace chart data
-            chart.replace_data(chart_data)
-            chart_found = True
-            print("✅ Missed by Month chart updated")
+        if chart_shape is None and shape.has_chart:
+            chart_shape = shape
+        elif totals_shape is None and shape.has_text_frame:
+            # Look for existing text box with "Rolling 12-Month" text
+            text_content = shape.text_frame.text
+            if "Rolling 12-Month" in text_content or "12-Month" in text_content:
+                totals_shape = shape
+        if chart_shape is not None and totals_shape is not None:
             break
     
-    # Update rolling totals text box
-    total_due = by_month_df[actual_columns['generated']].sum()
-    total_completed = by_month_df[actual_columns['completed']].sum()
-    total_missed = by_month_df[actual_columns['missed']].sum()
+    # Update chart with new data
+    if chart_shape is not None:
+        chart_shape.chart.replace_data(build_month_chart_data(by_month_df, month_labels, actual_columns))
+        chart_found = True
+        print("✅ Missed by Month chart updated")
+    
+    # Update rolling totals text box, summing the three columns in one numpy reduction
+    total_due, total_completed, total_missed = by_month_df[
+        [actual_columns['generated'], actual_columns['completed'], actual_columns['missed']]
+    ].to_numpy().sum(axis=0)
     
     print(f"📊 Rolling totals calculated:")
     print(f"  Total Due: {total_due}")
     print(f"  Total Completed: {total_completed}")
     print(f"  Total Missed: {total_missed}")
     
-    # Look for existing text box with "Rolling 12-Month" text
-    for shape in slide.shapes:
-        if hasattr(shape, "text_frame") and shape.text_frame:
-            text_content = shape.text_frame.text
-            if "Rolling 12-Month" in text_content or "12-Month" in text_content:
-                print("🎯 Found existing Rolling 12-Month text box - updating it")
-                print(f"📍 Template text box position: left={shape.left}, top={shape.top}, width={shape.width}, height={shape.height}")
-                
-                # Update the text content
-                new_text = f"12-Month Totals:\nDue: {total_due:,}\nCompleted: {total_completed:,}\nMissed: {total_missed:,}"
-                shape.text_frame.clear()
-                p = shape.text_frame.paragraphs[0]
-                p.text = new_text
-                p.font.size = Pt(18)
-                p.font.bold = True
-                
-                text_box_found = True
-                print(f"✅ Rolling 12-month totals updated in existing text box")
-                print(f"✅ Final text frame content: '{shape.text_frame.text}'")
-                break
+    if totals_shape is not None:
+        shape = totals_shape
+        print("🎯 Found existing Rolling 12-Month text box - updating it")
+        print(f"📍 Template text box position: left={shape.left}, top={shape.top}, width={shape.width}, height={shape.height}")
+        
+        # Update the text content
+        new_text = f"12-Month Totals:\nDue: {total_due:,}\nCompleted: {total_completed:,}\nMissed: {total_missed:,}"
+        shape.text_frame.clear()
+        p = shape.text_frame.paragraphs[0]
+        p.text = new_text
+        set_paragraph_font(p, SUMMARY_FONT_SIZE)
+        
+        text_box_found = True
+        print(f"✅ Rolling 12-month totals updated in existing text box")
+        print(f"✅ Final text frame content: '{shape.text_frame.text}'")
     
     # Add stoplight table (also needs to be updated)
-    add_stoplight_table_two_tables(prs, slide_index, by_month_df, month_column, actual_columns)
+    add_stoplight_table_two_tables(slide, by_month_df, month_column, actual_columns, month_labels)
     
     if not text_box_found:
         print("❌ Could not find existing 'Rolling 12-Month' text box in template")
         print("💡 Make sure your template has a text box containing 'Rolling 12-Month' text")
 
-def add_stoplight_table_two_tables(prs, slide_index=1, by_month_df=None, month_column='Month', actual_columns=None):
+def add_stoplight_table_two_tables(slide, by_month_df=None, month_column='Month', actual_columns=None, month_labels=None):
     """
     Creates two separate tables:
     1. Header table (1 row x 1 column) for the key
     2. Data table (2 rows x 12 columns) for months and stoplights
+    month_labels, when given, are the month column already converted to strings
     """
     try:
-        slide = prs.slides[slide_index]
-        
         # Extract months using the identified month column
         if by_month_df is not None and not by_month_df.empty:
-            months = by_month_df[month_column].astype(str).tolist()[:12]
+            if month_labels is None:
+                month_labels = by_month_df[month_column].astype(str).to_numpy().tolist()
+            months = month_labels[:12]
             print(f"📅 Using months from chart data: {months}")
         else:
             months = ['Oct-24', 'Nov-24', 'Dec-24', 'Jan-25', 'Feb-25', 'Mar-25',
@@ -341,6 +471,12 @@ def add_stoplight_table_two_tables(prs, slide_index=1, by_month_df=None, month_c
             months.append("")
         months = months[:12]
         
+        # Map each month to its (missed, completed) counts once, then classify all
+        # twelve missed percentages against the thresholds in one numpy call
+        month_counts = build_month_counts(by_month_df, month_column, actual_columns)
+        missed_percentages = calculate_performance_metrics(month_counts, months)
+        stoplight_levels = classify_stoplights(missed_percentages)
+        
         # === TABLE 1: HEADER TABLE ===
         print("📋 Creating header table...")
         header_left = Inches(0.42)
@@ -355,12 +491,11 @@ def add_stoplight_table_two_tables(prs, slide_index=1, by_month_df=None, month_c
         # Style header table
         header_cell = header_table.cell(0, 0)
         header_cell.text = "Stop Lights -  🔴: Missed > 6%,    🟡: MISSED >3% <=6%,    🟢 <=3%"
-        header_cell.text_frame.paragraphs[0].font.size = Pt(16)
-        header_cell.text_frame.paragraphs[0].font.bold = True
-        header_cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        header_cell.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)  # White text
+        header_paragraph = header_cell.text_frame.paragraphs[0]
+        set_paragraph_font(header_paragraph, TEXT_BOX_FONT_SIZE, color=WHITE)
+        header_paragraph.alignment = PP_ALIGN.CENTER
         header_cell.fill.solid()
-        header_cell.fill.fore_color.rgb = RGBColor(51, 153, 255)  # Light blue background
+        header_cell.fill.fore_color.rgb = LIGHT_BLUE
         
         print("✅ Header table created")
         
@@ -375,45 +510,36 @@ def add_stoplight_table_two_tables(prs, slide_index=1, by_month_df=None, month_c
         data_table_shape = slide.shapes.add_table(2, 12, data_left, data_top, data_width, data_height)
         data_table = data_table_shape.table
         
-        # Row 1: Month names
-        print("📅 Adding month names...")
-        for col, month in enumerate(months):
-            cell = data_table.cell(0, col)
+        # Fill both rows in a single pass over the months:
+        # row 1 holds the month names, row 2 the stoplight indicators
+        print("📅 Adding month names and 🚦 stoplight indicators...")
+        table_cell = data_table.cell
+        for col, (month, level) in enumerate(zip(months, stoplight_levels)):
+            cell = table_cell(0, col)
             cell.text = str(month) if month else ""
-            cell.text_frame.paragraphs[0].font.size = Pt(13)
-            cell.text_frame.paragraphs[0].font.bold = True
-            cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            cell.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
+            paragraph = cell.text_frame.paragraphs[0]
+            font = paragraph.font
+            font.size = MONTH_FONT_SIZE
+            font.bold = True
+            font.color.rgb = WHITE
+            paragraph.alignment = PP_ALIGN.CENTER
             # Light blue background for month row
             cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(51, 153, 255) 
+            cell.fill.fore_color.rgb = LIGHT_BLUE
             
-        # Row 2: Stoplight indicators
-        print("🚦 Adding stoplight indicators...")
-        for col, month in enumerate(months):
-            cell = data_table.cell(1, col)
+            cell = table_cell(1, col)
             
-            if month:  # Only calculate if we have a valid month
-                missed_percentage = calculate_performance_metric(by_month_df, month, month_column, actual_columns)
-                
-                # Determine stoplight color based on missed percentage
-                if missed_percentage > 6:
-                    stoplight = "🔴"  # RED: Missed > 6%
-                    bg_color = RGBColor(102, 0, 0)  # Light red
-                elif missed_percentage > 3:
-                    stoplight = "🟡"  # YELLOW: Missed >3% <=6%
-                    bg_color = RGBColor(204, 204, 0)  # Light yellow
-                else:
-                    stoplight = "🟢"  # GREEN: <=3%
-                    bg_color = RGBColor(0, 204, 0)  # Light green
+            if month:  # Only show a stoplight if we have a valid month
+                stoplight, bg_color = STOPLIGHTS[level]
             else:
                 # Empty cell for padding
                 stoplight = ""
-                bg_color = RGBColor(255, 255, 255)  # White background
+                bg_color = WHITE
             
             cell.text = stoplight
-            cell.text_frame.paragraphs[0].font.size = Pt(16)
-            cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+            paragraph = cell.text_frame.paragraphs[0]
+            paragraph.font.size = STOPLIGHT_FONT_SIZE
+            paragraph.alignment = PP_ALIGN.CENTER
             cell.fill.solid()
             cell.fill.fore_color.rgb = bg_color
         
@@ -431,60 +557,79 @@ def add_stoplight_table_two_tables(prs, slide_index=1, by_month_df=None, month_c
         traceback.print_exc()
         return None
 
-def calculate_performance_metric(by_month_df, month, month_column='Month', actual_columns=None):
+def build_month_counts(by_month_df, month_column='Month', actual_columns=None):
     """
-    Calculate missed percentage for stoplight determination
-    Formula: Missed / (Missed + Completed) * 100
-    Returns missed percentage (0-100)
+    Returns {month: (missed, completed)} for calculate_performance_metric,
+    or None when there is no chart data to look months up in
     """
     if by_month_df is None or actual_columns is None:
-        return 2  # Default value for testing (GREEN)
+        return None
+    
+    months = by_month_df[month_column].to_numpy().tolist()
+    counts = by_month_df[[actual_columns['missed'], actual_columns['completed']]].to_numpy().tolist()
+    # Built back to front so a repeated month keeps its first row
+    return dict(zip(reversed(months), map(tuple, reversed(counts))))
+
+def classify_stoplights(missed_percentages):
+    """
+    Returns each missed percentage's STOPLIGHTS level as a uint8 array:
+    0 = GREEN (<=3%), 1 = YELLOW (>3% <=6%), 2 = RED (>6%)
+    """
+    return np.searchsorted(STOPLIGHT_PERCENT_THRESHOLDS, missed_percentages, side='left').astype(np.uint8)
+
+def calculate_performance_metrics(month_counts, months):
+    """
+    Calculate missed percentage for stoplight determination for each month
+    Formula: Missed / (Missed + Completed) * 100
+    Returns a numpy array of missed percentages (0-100), 0 for months not found
+    """
+    if month_counts is None:
+        return np.full(len(months), 2.0)  # Default value for testing (GREEN)
+    
+    counts = [month_counts.get(month, (0, 0)) for month in months]
+    missed, completed = np.array(counts, dtype=float).reshape(-1, 2).T
     
-    # Find the row for this month
-    month_data = by_month_df[by_month_df[month_column] == month]
-    if not month_data.empty:
-        missed = month_data[actual_columns['missed']].iloc[0]
-        completed = month_data[actual_columns['completed']].iloc[0]
-        
-        # Calculate missed percentage: Missed / (Missed + Completed)
-        total_wo_processed = missed + completed
-        missed_percentage = (missed / total_wo_processed) * 100 if total_wo_processed > 0 else 0
-        
-        print(f"📊 {month}: Missed={missed}, Completed={completed}, Missed%={missed_percentage:.2f}%")
-        return missed_percentage
+    # Calculate missed percentage: Missed / (Missed + Completed)
+    total_wo_processed = missed + completed
+    missed_percentages = np.divide(missed, total_wo_processed, out=np.zeros_like(missed),
+                                   where=total_wo_processed > 0) * 100
     
-    return 0  # Default if month not found
+    for month, (missed_count, completed_count), missed_percentage in zip(months, counts, missed_percentages):
+        if month in month_counts:
+            print(f"📊 {month}: Missed={missed_count}, Completed={completed_count}, Missed%={missed_percentage:.2f}%")
+    return missed_percentages
 
-def update_missed_disposition_chart(prs, disposition_df, slide_index=2):
+def update_missed_disposition_chart(slide, disposition_df):
     """
     Updates the missed disposition chart on slide 2
     """
+    from pptx.chart.data import CategoryChartData  # chart-only, loaded on first use
     try:
         if disposition_df is None or disposition_df.empty:
             print("⚠️ No disposition data provided - skipping disposition chart")
             return
         
-        slide = prs.slides[slide_index]
-        
-        print(f"🔍 DEBUG: disposition_df columns: {disposition_df.columns.tolist()}")
-        print(f"🔍 DEBUG: disposition_df shape: {disposition_df.shape}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 disposition_df columns: {disposition_df.columns.tolist()}")
+            logger.debug(f"🔍 disposition_df shape: {disposition_df.shape}")
         
         # FIX: Sort months chronologically instead of alphabetically
-        def month_sort_key(month_str):
-            """Convert month string to sortable format"""
-            try:
-                # Parse "MMM-YY" format (e.g., "Oct-24")
-                month_date = pd.to_datetime(month_str, format='%b-%y')
-                return month_date
-            except:
-                return pd.to_datetime('1900-01-01')  # Default for invalid dates
-        
-        # Sort disposition_df by month chronologically
-        disposition_df_sorted = disposition_df.copy()
-        disposition_df_sorted['sort_key'] = disposition_df_sorted['report_month'].apply(month_sort_key)
-        disposition_df_sorted = disposition_df_sorted.sort_values('sort_key').drop('sort_key', axis=1)
-        
-        print(f"🔍 DEBUG: Months after sorting: {disposition_df_sorted['report_month'].tolist()}")
+        # Pull the month labels out once; they are both the sort key and the
+        # chart categories. Parse "MMM-YY" labels (e.g., "Oct-24") in one pass,
+        # each distinct label only once; invalid labels sort first
+        month_labels = disposition_df['report_month'].astype(str).to_numpy()
+        month_sort_key = pd.to_datetime(
+            month_labels, format='%b-%y', errors='coerce', cache=True
+        ).fillna(pd.Timestamp('1900-01-01'))
+        
+        # Sort disposition_df by month chronologically, taking rows in key order
+        # instead of copying the frame to add and then drop a sort column
+        month_order = np.argsort(month_sort_key.to_numpy(), kind='stable')
+        disposition_df_sorted = disposition_df.iloc[month_order]
+        month_labels = month_labels[month_order].tolist()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"🔍 Months after sorting: {month_labels}")
         
         # Map column names
         disposition_columns = {
@@ -496,21 +641,24 @@ def update_missed_disposition_chart(prs, disposition_df, slide_index=2):
         
         print(f"📊 Disposition column mapping: {disposition_columns}")
         
-        # Find existing chart and remove it first
-        for shape in slide.shapes:
-            if hasattr(shape, "chart"):
-                chart_position = {
-                    'left': shape.left,
-                    'top': shape.top, 
-                    'width': shape.width,
-                    'height': shape.height
-                }
-                print(f"🎯 Found chart at position: {chart_position}")
-                
-                # Remove the existing chart
-                slide.shapes._spTree.remove(shape._element)
-                print("🗑️ Removed problematic chart")
-                break
+        # Find existing charts first, then remove them, so the shape tree is
+        # never modified while it is being walked
+        chart_shapes = [shape for shape in slide.shapes if shape.has_chart]
+        if chart_shapes:
+            shape = chart_shapes[0]
+            chart_position = {
+                'left': shape.left,
+                'top': shape.top, 
+                'width': shape.width,
+                'height': shape.height
+            }
+            print(f"🎯 Found chart at position: {chart_position}")
+            
+            # Remove the existing charts; the new chart below replaces them
+            sp_tree = slide.shapes._spTree
+            for shape in chart_shapes:
+                sp_tree.remove(shape._element)
+            print("🗑️ Removed problematic chart")
         
         # Create new chart
         try:
@@ -522,10 +670,11 @@ def update_missed_disposition_chart(prs, disposition_df, slide_index=2):
             
             # Prepare chart data
             chart_data = CategoryChartData()
-            chart_data.categories = disposition_df_sorted[disposition_columns['month']].astype(str).tolist()
-            chart_data.add_series('Closed', disposition_df_sorted[disposition_columns['closed']].tolist())
-            chart_data.add_series('Awaiting QA', disposition_df_sorted[disposition_columns['awaiting_qa']].tolist())
-            chart_data.add_series('Awaiting Dept', disposition_df_sorted[disposition_columns['awaiting_dept']].tolist())
+            chart_data.categories = month_labels
+            # Pull the three disposition series out as one numpy block; column slices are views
+            values = disposition_df_sorted[[disposition_columns[key] for _, key, _ in DISPOSITION_SERIES]].to_numpy()
+            for i, (name, _, _) in enumerate(DISPOSITION_SERIES):
+                chart_data.add_series(name, values[:, i].tolist())
             
             # Add chart
             chart_shape = slide.shapes.add_chart(
@@ -539,29 +688,15 @@ def update_missed_disposition_chart(prs, disposition_df, slide_index=2):
             print("✅ Applied Style 8 to chart")
             
             # Color the series
-            series_colors = {
-                'Closed': '28A745',      # Green
-                'Awaiting QA': 'FFC107', # Yellow  
-                'Awaiting Dept': 'DC3545' # Red
-            }
-            
-            for i, series in enumerate(chart.series):
-                series_name = ['Closed', 'Awaiting QA', 'Awaiting Dept'][i]
-                if series_name in series_colors:
-                    color_hex = series_colors[series_name]
-                    r = int(color_hex[0:2], 16)
-                    g = int(color_hex[2:4], 16)
-                    b = int(color_hex[4:6], 16)
-                    series.format.fill.solid()
-                    series.format.fill.fore_color.rgb = RGBColor(r, g, b)
-                    print(f"  ✅ Formatted series '{series_name}' with color {color_hex}")
+            for series, (series_name, _, color) in zip(chart.series, DISPOSITION_SERIES):
+                series.format.fill.solid()
+                series.format.fill.fore_color.rgb = color
+                print(f"  ✅ Formatted series '{series_name}' with color {color}")
             
             print("✅ Successfully created new disposition chart")
             
             # Print summary
-            total_missed = disposition_df_sorted[[disposition_columns['closed'], 
-                                     disposition_columns['awaiting_qa'], 
-                                     disposition_columns['awaiting_dept']]].sum().sum()
+            total_missed = values.sum()
             print(f"📈 Disposition summary: Total missed work orders = {total_missed}")
             
         except Exception as e:
@@ -572,93 +707,85 @@ def update_missed_disposition_chart(prs, disposition_df, slide_index=2):
         print(f"❌ Error updating disposition chart: {e}")
         traceback.print_exc()
 
-def update_group_charts(prs, by_group_df, slide_index=3):
+def update_group_charts(slides, by_group_df):
     """
-    Updates group-based charts on slides 3 and 4
+    Updates group-based charts on slides 3 and 4 of the deck's slide list
     """
+    from pptx.chart.data import CategoryChartData  # chart-only, loaded on first use
     if by_group_df is None or by_group_df.empty:
         print("⚠️ No group data provided - skipping group charts")
         return
     
     # Debug: Print DataFrame info
-    print("🔍 DEBUG: by_group_df columns:", by_group_df.columns.tolist())
-    print("🔍 DEBUG: by_group_df shape:", by_group_df.shape)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"🔍 by_group_df columns: {by_group_df.columns.tolist()}")
+        logger.debug(f"🔍 by_group_df shape: {by_group_df.shape}")
     
     # Map column names for group charts
-
-    group_column_mapping = {
-        'group': ['group', 'Group', 'GROUP'],
-        'missed': ['missed', 'Missed', 'MISSED'],
-        'missed_percentage': ['missed_percentage', 'Missed %', 'missed_pct', 'Miss %'],
-        'still_open': ['still_open', 'Still Open', 'Open', 'OPEN']
-    }
-    
-    # Find actual column names
-    actual_group_columns = {}
-    for standard_name, possible_names in group_column_mapping.items():
-        for possible_name in possible_names:
-            if possible_name in by_group_df.columns:
-                actual_group_columns[standard_name] = possible_name
-                break
+    actual_group_columns = resolve_columns(by_group_df, GROUP_COLUMN_CANDIDATES)
     
     print(f"📊 Group column mapping: {actual_group_columns}")
     
-    # Chart titles to look for
-    chart_titles = [
-        "Qty Missed by Group",
-        "% Missed by Group", 
-        "Missed Still Open by Group"
-    ]
-    
     # Debug: Check all slides for charts
-    print("🔍 DEBUG: Searching all slides for group charts:")
-    for slide_idx, check_slide in enumerate(prs.slides):
-        for shape in check_slide.shapes:
-            try:
-                chart = shape.chart
-                title = chart.chart_title.text_frame.text if chart.has_title else "Unknown Chart"
-                if any(t in title for t in chart_titles):
-                    print(f"  - Found on slide {slide_idx}: '{title}'")
-            except:
-                pass  # Shape doesn't contain a chart
+    # This walks every shape in the deck, so it only runs when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 Searching all slides for group charts:")
+        for slide_idx, check_slide in enumerate(slides):
+            for shape in check_slide.shapes:
+                if not shape.has_chart:
+                    continue  # Shape doesn't contain a chart
+                try:
+                    chart = shape.chart
+                    title = chart.chart_title.text_frame.text if chart.has_title else "Unknown Chart"
+                    if any(t in title for t in GROUP_CHART_TITLES):
+                        logger.debug(f"  - Found on slide {slide_idx}: '{title}'")
+                except:
+                    pass  # Chart title couldn't be read
+    
+    # Every group chart shares the same categories, and each series feeds at most
+    # one chart, so convert the columns to lists once rather than per chart.
+    # numpy's tolist() unboxes straight from the array, skipping Series overhead
+    categories_list = by_group_df[actual_group_columns['group']].to_numpy().tolist() if 'group' in actual_group_columns else None
+    series_values = {
+        standard_name: by_group_df[column].to_numpy().tolist()
+        for standard_name, column in actual_group_columns.items()
+        if standard_name != 'group'
+    }
     
     # Process all slides that might have group charts (slides 3 and 4)
-    for slide_idx in [3, 4]:
-        if slide_idx >= len(prs.slides):
-            continue
-            
-        slide = prs.slides[slide_idx]
+    for slide_idx, slide in enumerate(slides[3:5], start=3):
         print(f"\n🔍 Processing slide {slide_idx}...")
     
         for shape in slide.shapes:
+            if not shape.has_chart:
+                continue  # Shape doesn't contain a chart
             try:
                 chart = shape.chart
                 chart_title = chart.chart_title.text_frame.text if chart.has_title else "Unknown Chart"
                 
-                if chart_title in chart_titles:
+                if chart_title in GROUP_CHART_TITLES:
                     print(f"Updating chart on slide {slide_idx}: {chart_title}")
                     
                     try:
                         # Check if we have required columns for this chart
-                        if 'group' not in actual_group_columns:
+                        if categories_list is None:
                             print(f"⚠️ No group column found - skipping {chart_title}")
                             continue
                         
                         # Update chart data based on title
                         chart_data = CategoryChartData()
-                        categories_list = by_group_df[actual_group_columns['group']].tolist()
                         chart_data.categories = categories_list
                         
                         # Debug: Print what categories we're setting
-                        print(f"🔍 DEBUG: Categories for {chart_title}: {categories_list}")
+                        logger.debug("🔍 Categories for %s: %s", chart_title, categories_list)
                         
-                        if "Qty Missed" in chart_title and 'missed' in actual_group_columns:
-                            chart_data.add_series('Missed', by_group_df[actual_group_columns['missed']].tolist())
-                        elif "% Missed" in chart_title and 'missed_percentage' in actual_group_columns:
-                            chart_data.add_series('% Missed', by_group_df[actual_group_columns['missed_percentage']].tolist())
-                        elif "Still Open" in chart_title and 'still_open' in actual_group_columns:
-                            still_open_values = by_group_df[actual_group_columns['still_open']].tolist()
-                            print(f"🔍 DEBUG: Still Open values: {still_open_values}")
+                        if "Qty Missed" in chart_title and 'missed' in series_values:
+                            chart_data.add_series('Missed', series_values['missed'])
+                        elif "% Missed" in chart_title and 'missed_percentage' in series_values:
+                            chart_data.add_series('% Missed', series_values['missed_percentage'])
+                        elif "Still Open" in chart_title and 'still_open' in series_values:
+                            still_open_values = series_values['still_open']
+                            logger.debug("🔍 Still Open values: %s", still_open_values)
                             chart_data.add_series('Still Open', still_open_values)
                         else:
                             print(f"⚠️ Required columns not found for {chart_title}")
@@ -671,17 +798,16 @@ def update_group_charts(prs, by_group_df, slide_index=3):
                     except Exception as e:
                         print(f"❌ Error updating {chart_title}: {e}")
             except:
-                pass  # Shape doesn't contain a chart
+                pass  # Chart title couldn't be read
 
 def generate_summary_stats(by_month_df, disposition_df, by_group_df):
     """
     Generates summary statistics for the governance deck
     """
     try:
-        # Monthly totals
-        total_generated = by_month_df['generated'].sum()
-        total_completed = by_month_df['completed'].sum() 
-        total_missed = by_month_df['missed'].sum()
+        # Monthly totals, all three columns in one reduction
+        counts = by_month_df[TOTAL_COLUMNS].to_numpy()
+        total_generated, total_completed, total_missed = counts.sum(axis=0)
         
         # Performance metrics
         completion_rate = (total_completed / total_generated * 100) if total_generated > 0 else 0
@@ -692,8 +818,8 @@ def generate_summary_stats(by_month_df, disposition_df, by_group_df):
         best_group = by_group_df.loc[by_group_df['missed_percentage'].idxmin(), 'group'] if not by_group_df.empty else 'N/A'
         
         # Recent trend (last 3 months)
-        recent_months = by_month_df.tail(3)
-        recent_miss_rate = (recent_months['missed'].sum() / recent_months['generated'].sum() * 100) if recent_months['generated'].sum() > 0 else 0
+        recent_generated, _, recent_missed = counts[-3:].sum(axis=0)
+        recent_miss_rate = (recent_missed / recent_generated * 100) if recent_generated > 0 else 0
         
         summary = {
             'total_generated': total_generated,
@@ -736,11 +862,11 @@ def validate_slide_content(prs):
             text_boxes = 0
             
             for shape in slide.shapes:
-                if hasattr(shape, "chart"):
+                if shape.has_chart:
                     charts += 1
-                elif hasattr(shape, "table"):
+                elif shape.has_table:
                     tables += 1
-                elif hasattr(shape, "text_frame"):
+                elif shape.has_text_frame:
                     text_boxes += 1
             
             print(f"  Charts: {charts}, Tables: {tables}, Text boxes: {text_boxes}")
@@ -8,12 +8,17 @@
 
 from pptx import Presentation
 from pptx.chart.data import CategoryChartData
+import numpy as np
 import pandas as pd
 import logging
 import os
 
 logging.basicConfig(level=logging.INFO)
 
+def chart_shapes_by_name(slide):
+    """Maps each chart shape's name to the shape, walking the slide's shapes once."""
+    return {shape.name: shape for shape in slide.shapes if shape.has_chart}
+
 def update_pm_missed_chart(prs, slide_index, chart_name, chart_data):
     """
     Updates the PM Missed Chart on a specified slide in the PowerPoint presentation.
@@ -29,11 +34,7 @@ def update_pm_missed_chart(prs, slide_index, chart_name, chart_data):
         - No return value; modifies prs in place.
     """
     slide = prs.slides[slide_index]
-    chart_shape = None
-    for shape in slide.shapes:
-        if hasattr(shape, "chart") and shape.name == chart_name:
-            chart_shape = shape
-            break
+    chart_shape = chart_shapes_by_name(slide).get(chart_name)
     if not chart_shape:
         logging.warning(f"Chart '{chart_name}' not found on slide {slide_index+1}.")
         return
@@ -59,23 +60,18 @@ def update_group_charts(prs, group_data, slide_index):
         - No return value; modifies prs in place.
     """
     slide = prs.slides[slide_index]
-    qty_chart_shape = None
-    percent_chart_shape = None
-    for shape in slide.shapes:
-        if hasattr(shape, "chart"):
-            if shape.name == "Qty Missed by Group":
-                qty_chart_shape = shape
-            elif shape.name == "% Missed by Group":
-                percent_chart_shape = shape
-    filtered = [
-        (g, m, p)
-        for g, m, p in zip(group_data["groups"], group_data["missed"], group_data["missed_percent"])
-        if m > 0
-    ]
-    if not filtered:
+    chart_shapes = chart_shapes_by_name(slide)
+    qty_chart_shape = chart_shapes.get("Qty Missed by Group")
+    percent_chart_shape = chart_shapes.get("% Missed by Group")
+    # One boolean mask over the missed counts selects the same groups from every column
+    missed_values = np.asarray(group_data["missed"])
+    has_missed = missed_values > 0
+    if not has_missed.any():
         logging.warning("No groups with missed work orders.")
         return
-    groups, missed, missed_percent = zip(*filtered)
+    groups = np.asarray(group_data["groups"])[has_missed].tolist()
+    missed = missed_values[has_missed].tolist()
+    missed_percent = np.asarray(group_data["missed_percent"])[has_missed].tolist()
     if qty_chart_shape:
         qty_data = CategoryChartData()
         qty_data.categories = groups
@@ -20,14 +20,76 @@
 #     generate_governance_overview, export_governance_report, generate_pm_breakdowns,
 #     generate_monthly_governance_overview, generate_pm_governance_breakdown, generate_group_governance_report.
 #   - Handles sorting, aggregation, and formatting for reporting.
+#   - Excel reports are streamed row by row with xlsxwriter's constant_memory mode.
 # ---------------------------------------------------------------
 
 # scripts/summary_generator.py
 
 import os
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from datetime import date
 from config.settings import REPORT_DIR
+from scripts.data_loader import as_datetime
+
+# Statuses of work orders still being worked, checked by get_extreme_late_work_orders
+LATE_OPEN_STATUSES = frozenset({"APPR", "INPRG", "WAPPR"})
+
+def summarize_class_counts(counts, percent_column="missed_percent"):
+    """
+    Derives missed, completed, generated, percentage and still-open columns
+    from a table of work order counts with one column per wo_class.
+    """
+    generated = counts.sum(axis=1)
+    counts = counts.reindex(columns=["missed", "on_time", "open"], fill_value=0)
+
+    return pd.DataFrame({
+        "missed": counts["missed"],
+        "completed": counts["on_time"],
+        "generated": generated,
+        percent_column: 100 * counts["missed"] / generated,
+        "still_open": counts["open"],
+    })
+
+def summarize_wo_classes(df, keys, percent_column="missed_percent"):
+    """
+    Counts missed, completed, generated and still-open work orders per key
+    in a single groupby pass instead of one Python lambda per metric.
+    """
+    # wo_class joins the group keys rather than going through value_counts, which
+    # would expand a categorical wo_class over every combination of multiple keys
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    counts = df.groupby([*keys, "wo_class"], observed=True).size().unstack(fill_value=0)
+    return summarize_class_counts(counts, percent_column).reset_index()
+
+def fill_missing_group(group):
+    """Fills missing group labels with 'Unassigned', keeping a categorical dtype intact."""
+    if isinstance(group.dtype, pd.CategoricalDtype) and "Unassigned" not in group.cat.categories:
+        group = group.cat.add_categories("Unassigned")
+    return group.fillna("Unassigned")
+
+def normalize_wo_class(wo_class):
+    """
+    Strips and lowercases wo_class labels. A categorical column is cleaned once
+    per category and mapped through its codes instead of once per row.
+    """
+    if isinstance(wo_class.dtype, pd.CategoricalDtype):
+        categories = wo_class.cat.categories
+        cleaned = categories.astype(str).str.strip().str.lower()
+        if cleaned.equals(categories):
+            return wo_class
+        # Labels that only differed by case or spacing merge into one category;
+        # the trailing -1 keeps missing values (code -1) missing
+        new_categories = cleaned.unique()
+        category_codes = np.append(new_categories.get_indexer(cleaned), -1)
+        codes = category_codes[wo_class.cat.codes.to_numpy()]
+        return pd.Series(
+            pd.Categorical.from_codes(codes, new_categories),
+            index=wo_class.index,
+            name=wo_class.name,
+        )
+    return wo_class.str.strip().str.lower()
 
 def generate_monthly_summary(df):
      # Ensure wo_class and report_month columns exist
@@ -36,7 +98,31 @@ def generate_monthly_summary(df):
     if "report_month" not in df.columns or "wo_class" not in df.columns:  # wo_class is the classification each work order is placed in
         raise ValueError("Missing 'report_month' or 'wo_class'. Run classfier first.")
 
-    summary = df.groupby("report_month")["wo_class"].value_counts().unstack(fill_value=0)
+    summary = df.groupby("report_month", observed=True)["wo_class"].value_counts().unstack(fill_value=0)
+    return format_monthly_summary(summary)
+
+def sort_by_month(df, column="Month"):
+    """
+    Sorts df chronologically by its "Mon-YY" label column, parsing the labels only once.
+    Labels that are not months (such as "Grand Total") sort after every month.
+    """
+    # cache=True parses each distinct label once
+    month_dt = pd.to_datetime(df[column].str.strip(), format="%b-%y", errors="coerce", cache=True)
+
+    # Callers usually pass months that are already in order; skip the sort then
+    month_count = int(month_dt.notna().sum())
+    if month_dt.iloc[:month_count].is_monotonic_increasing and month_dt.iloc[month_count:].isna().all():
+        return df.reset_index(drop=True)
+
+    # numpy places NaT after every date, so non-month labels stay at the end
+    order = np.argsort(month_dt.to_numpy(), kind="stable")
+    return df.iloc[order].reset_index(drop=True)
+
+def format_monthly_summary(summary, grand_total=True):
+    """
+    Builds the monthly summary table from per-month wo_class counts, with a
+    Grand Total row unless grand_total is False.
+    """
     summary["total_due"] = summary.sum(axis=1)
     summary["completion_pct"] = (summary.get("on_time", 0) / summary["total_due"]) * 100
     summary = summary.reset_index().rename(columns={"report_month": "Month"})
@@ -54,33 +140,54 @@ def generate_monthly_summary(df):
             "status": "Status"
          })
 
-    columns_to_sum = ["Completed", "Missed", "Still Open", "Due", "Canceled"]
-    existing_columns = [col for col in columns_to_sum if col in summary.columns]
-    summary.loc["Grand Total", existing_columns] = summary[existing_columns].dropna(axis=1, how="all").sum()
-    summary.loc["Grand Total", "Completion %"] = (
-        summary.loc["Grand Total", "Completed"] / summary.loc["Grand Total", "Due"]
-    ) * 100
+    if grand_total:
+        columns_to_sum = ["Completed", "Missed", "Still Open", "Due", "Canceled"]
+        existing_columns = [col for col in columns_to_sum if col in summary.columns]
+        totals = summary[existing_columns].dropna(axis=1, how="all").sum()
+        summary.loc["Grand Total", existing_columns] = totals
 
-    # Round percentage
-    summary.loc["Grand Total", "Completion %"] = round(summary.loc["Grand Total", "Completion %"], 2)
+        # Rounded percentage, computed from the plain totals rather than reading
+        # the new mixed-dtype row back cell by cell
+        summary.loc["Grand Total", "Completion %"] = round(
+            totals.get("Completed", np.nan) / totals.get("Due", np.nan) * 100, 2
+        )
 
-    # Add a grand total row
+    # Period months are only formatted here, on the small summary frame; the groupby
+    # that produced them already returned them in chronological order
+    months_sorted = isinstance(summary["Month"].dtype, pd.PeriodDtype)
+    if months_sorted:
+        summary["Month"] = summary["Month"].dt.strftime("%b-%y")
     summary["Month"] = summary["Month"].astype(str)
-    summary.loc["Grand Total", "Month"] = "Grand Total"
+    if grand_total:
+        summary.loc["Grand Total", "Month"] = "Grand Total"
+
+    # The Grand Total row was added last, so Period months are already in report
+    # order; string labels are sorted in one pass that keeps Grand Total at the end,
+    # instead of splitting the frame and concatenating it back together
+    if months_sorted:
+        summary = summary.reset_index(drop=True)
+    else:
+        summary = sort_by_month(summary)
 
-    # Separate out the Grand Total row
-    grand_total_row = summary[summary["Month"] == "Grand Total"]
-    summary_no_total = summary[summary["Month"] != "Grand Total"]
+    return summary
 
-    # Sort only the actual months
-    summary_no_total = summary_no_total.sort_values(
-        "Month", key=lambda x: pd.to_datetime(x.str.strip(), format="%b-%y"), ignore_index=True
-    )
+# constant_memory flushes each row to disk as soon as the next one starts
+EXCEL_WRITE_OPTIONS = {
+    "constant_memory": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
 
-    # Concatenate the sorted months and the Grand Total row
-    summary = pd.concat([summary_no_total, grand_total_row], ignore_index=True)
+def write_sheet_rows(workbook, sheet_name, df):
+    """
+    Writes a DataFrame to a new worksheet strictly row by row, as constant_memory
+    requires (DataFrame.to_excel writes column by column and would lose cells).
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(col) for col in df.columns])
 
-    return summary
+    values = df.astype(object).where(df.notna(), None)
+    for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, row)
 
 def export_summary_to_excel(summary_df, late_df, filename=None):
     # Generate filename with previous month abbreviation if not provided
@@ -89,7 +196,7 @@ def export_summary_to_excel(summary_df, late_df, filename=None):
         print(f"🔍 DEBUG: Today's date: {today}")
         
         # Get previous month
-        previous_month = today.replace(day=1) - pd.DateOffset(months=1)
+        previous_month = today.to_period("M") - 1
         print(f"🔍 DEBUG: Previous month: {previous_month}")
         
         month_abbr = previous_month.strftime("%b")  # Three-letter abbreviation (Jan, Feb, Mar, etc.)
@@ -113,10 +220,10 @@ def export_summary_to_excel(summary_df, late_df, filename=None):
             )
 
     # 2) Write the new report
-    with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-        summary_df.to_excel(writer, sheet_name="Monthly Summary", index=False)
+    with xlsxwriter.Workbook(filepath, EXCEL_WRITE_OPTIONS) as workbook:
+        write_sheet_rows(workbook, "Monthly Summary", summary_df)
         if late_df is not None:
-            late_df.to_excel(writer, sheet_name="Late >90 Days", index=False)
+            write_sheet_rows(workbook, "Late >90 Days", late_df)
 
     print(f"✅ File saved as: {filename}")
     return filepath
@@ -126,11 +233,16 @@ def export_summary_to_excel(summary_df, late_df, filename=None):
 
 def get_extreme_late_work_orders(df, days_late=90):
     today = pd.Timestamp.today()
-    late_df = df[df["status"].isin(["APPR", "INPRG", "WAPPR"])].copy()
-    late_df["late_days"] = (today - late_df["target_date"]).dt.days
-    late_df = late_df.query("late_days > @days_late").copy()
 
-    late_df["report_month"] = late_df["target_date"].dt.to_period("M").astype(str)
+    # One combined mask over status and age; only the matching rows are copied
+    late_days = (today - df["target_date"]).dt.days
+    mask = df["status"].isin(LATE_OPEN_STATUSES) & (late_days > days_late)
+
+    late_df = df.loc[mask, ["work_order", "group", "target_date", "description", "wo_class", "status"]]
+    late_df = late_df.assign(
+        report_month=late_df["target_date"].dt.to_period("M").astype(str),
+        late_days=late_days[mask],
+    )
     late_df = late_df[
         [
             "report_month",
@@ -149,16 +261,18 @@ def get_extreme_late_work_orders(df, days_late=90):
 def generate_governance_overview(df):
     # Example: group by month and aggregate
     df["report_month"] = pd.to_datetime(df["target_date"]).dt.strftime("%b-%y")
-    summary = (
-        df.groupby("report_month")
-        .agg(
-            Due=("work_order", "count"),
-            Completed=("wo_class", lambda x: (x == "on_time").sum()),
-            Missed=("wo_class", lambda x: (x == "missed").sum()),
-            Canceled=("wo_class", lambda x: (x == "canceled").sum()),
-        )
-        .reset_index()
+    due = df.groupby("report_month", observed=True)["work_order"].count()
+    # One crosstab pass replaces a Python lambda per class
+    class_counts = (
+        pd.crosstab(df["report_month"], df["wo_class"])
+        .reindex(index=due.index, columns=["on_time", "missed", "canceled"], fill_value=0)
     )
+    summary = pd.DataFrame({
+        "Due": due,
+        "Completed": class_counts["on_time"],
+        "Missed": class_counts["missed"],
+        "Canceled": class_counts["canceled"],
+    }).reset_index()
     summary["Completion %"] = 100 * summary["Completed"] / summary["Due"]
     summary = summary.rename(columns={"report_month": "Month"})
     return {"summary": summary}
@@ -168,17 +282,17 @@ def export_governance_report(data_dict, filename="governance_overview.xlsx"):
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
 
-    with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-        data_dict["summary"].to_excel(writer, sheet_name="PM Totals", index=False)
+    with xlsxwriter.Workbook(filepath, EXCEL_WRITE_OPTIONS) as workbook:
+        write_sheet_rows(workbook, "PM Totals", data_dict["summary"])
         # You can add more sheets later like:
-        # data_dict["by_group"].to_excel(writer, sheet_name="PM by Group", index=False)
+        # write_sheet_rows(workbook, "PM by Group", data_dict["by_group"])
 
     print(f"✅ Governance report saved to: {filepath}")
 
 def generate_pm_breakdowns(df):
-    df["wo_class"] = df["wo_class"].str.strip().str.lower()
-    df["group"] = df["group"].fillna("Unassigned")
-    df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce")
+    df["wo_class"] = normalize_wo_class(df["wo_class"])
+    df["group"] = fill_missing_group(df["group"])
+    df["target_date"] = as_datetime(df["target_date"])
 
     # Format for display and sorting
     df["report_month"] = df["target_date"].dt.strftime("%b-%y")
@@ -186,7 +300,7 @@ def generate_pm_breakdowns(df):
 
     # Count missed, completed, and total (generated) per month
     monthly_counts = (
-        df.groupby(["report_month", "month_sort", "wo_class"])
+        df.groupby(["report_month", "month_sort", "wo_class"], observed=True)
         .size()
         .unstack(fill_value=0)
         .reset_index()
@@ -204,18 +318,7 @@ def generate_pm_breakdowns(df):
     by_month = monthly_counts[["report_month", "missed", "completed", "generated"]]
 
     # --- FIX: Aggregate by group with all needed columns ---
-    by_group = (
-        df
-        .groupby("group")
-        .agg(
-            missed=("wo_class", lambda x: (x == "missed").sum()),
-            completed=("wo_class", lambda x: (x == "on_time").sum()),
-            generated=("wo_class", "count"),
-            missed_percent=("wo_class", lambda x: 100 * (x == "missed").sum() / len(x)),
-            still_open=("wo_class", lambda x: (x == "open").sum())
-        )
-        .reset_index()
-    )
+    by_group = summarize_wo_classes(df, "group")
 
     return {
         "by_group": by_group,
@@ -224,93 +327,74 @@ def generate_pm_breakdowns(df):
 
 
 def generate_monthly_governance_overview(df):
-    df["wo_class"] = df["wo_class"].str.strip().str.lower()
-    df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce")
+    df["wo_class"] = normalize_wo_class(df["wo_class"])
+    df["target_date"] = as_datetime(df["target_date"])
     df["report_month"] = df["target_date"].dt.strftime("%b-%y")
 
-    def summarize(group):
-        total_due = len(group)
-        total_completed = len(group[group["wo_class"] == "on_time"])
-        total_missed = len(group[group["wo_class"] == "missed"])
-        completion_pct = round((total_completed / total_due) * 100, 1) if total_due > 0 else 0
-        return pd.Series({
-            "due": total_due,
-            "completed": total_completed,
-            "missed": total_missed,
-            "completion_pct": completion_pct
-        })
-
-    monthly_summary = df.groupby("report_month").apply(summarize).reset_index()
+    # Build each class mask once and sum it per month instead of filtering every group
+    wo_class = df["wo_class"]
+    monthly_summary = (
+        df.assign(is_completed=wo_class.eq("on_time"), is_missed=wo_class.eq("missed"))
+        .groupby("report_month", observed=True)
+        .agg(
+            due=("wo_class", "size"),
+            completed=("is_completed", "sum"),
+            missed=("is_missed", "sum"),
+        )
+        .reset_index()
+    )
+    monthly_summary["completion_pct"] = (100 * monthly_summary["completed"] / monthly_summary["due"]).round(1)
     return monthly_summary.sort_values("report_month")
 
 def generate_pm_governance_breakdown(df):
-    df["wo_class"] = df["wo_class"].str.strip().str.lower()
-    df["group"] = df["group"].fillna("Unassigned")
-    df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce")
+    df["wo_class"] = normalize_wo_class(df["wo_class"])
+    df["group"] = fill_missing_group(df["group"])
+    df["target_date"] = as_datetime(df["target_date"])
 
     # Format for display and sorting
     df["report_month"] = df["target_date"].dt.strftime("%b-%y")
     df["month_sort"] = df["target_date"].dt.to_period("M").dt.to_timestamp()
 
     # Missed, completed, and total (generated) per month
-    monthly_summary = (
-        df.groupby(["report_month", "month_sort"])
-        .agg(
-            missed=("wo_class", lambda x: (x == "missed").sum()),
-            completed=("wo_class", lambda x: (x == "on_time").sum()),
-            generated=("wo_class", "count"),
-            completion_pct=("wo_class", lambda x: 100 * (x == "on_time").sum() / len(x)),
-            still_open=("wo_class", lambda x: (x == "open").sum())
-        )
-        .reset_index()
-        .sort_values("month_sort")
-    )
+    monthly_summary = summarize_wo_classes(df, ["report_month", "month_sort"], percent_column="completion_pct")
+    monthly_summary["completion_pct"] = 100 * monthly_summary["completed"] / monthly_summary["generated"]
+    monthly_summary = monthly_summary.sort_values("month_sort")
 
     return monthly_summary
 
 def generate_group_governance_report(df):
-    df["wo_class"] = df["wo_class"].str.strip().str.lower()
-    df["group"] = df["group"].fillna("Unassigned")
-    df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce")
+    df["wo_class"] = normalize_wo_class(df["wo_class"])
+    df["group"] = fill_missing_group(df["group"])
+    df["target_date"] = as_datetime(df["target_date"])
 
     # Missed, completed, and total (generated) per group
-    by_group = (
-        df
-        .groupby("group")
-        .agg(
-            missed=("wo_class", lambda x: (x == "missed").sum()),
-            completed=("wo_class", lambda x: (x == "on_time").sum()),
-            generated=("wo_class", "count"),
-            missed_percent=("wo_class", lambda x: 100 * (x == "missed").sum() / len(x)),
-            still_open=("wo_class", lambda x: (x == "open").sum())
-        )
-        .reset_index()
-    )
+    by_group = summarize_wo_classes(df, "group")
 
     return by_group
 
 def generate_12_month_trend(df):
     # Ensure target_date is datetime
-    df["target_date"] = pd.to_datetime(df["target_date"], errors="coerce")
+    df["target_date"] = as_datetime(df["target_date"])
+
+    # Last 12 complete months (ending with previous month); each month covers
+    # (1st, next 1st], so shifting by 1ns before taking the Period keeps those boundaries
+    current_period = pd.Timestamp.today().to_period("M")
+    last_12_periods = pd.period_range(end=current_period - 1, periods=12, freq="M")
+    report_period = (df["target_date"] - pd.Timedelta(1, "ns")).dt.to_period("M")
+
+    trend = pd.DataFrame(index=last_12_periods)
+    trend["generated"] = report_period.value_counts().reindex(last_12_periods, fill_value=0)
+    if "wo_class" in df.columns:
+        class_counts = (
+            pd.crosstab(report_period, df["wo_class"])
+            .reindex(index=last_12_periods, columns=["missed", "on_time"], fill_value=0)
+        )
+        trend["missed"] = class_counts["missed"]
+        trend["completed"] = class_counts["on_time"]
+    else:
+        trend["missed"] = None
+        trend["completed"] = None
 
-    today = pd.Timestamp.today()
-    first_of_current = today.replace(day=1)
-    # Build boundaries for the last 12 complete months (ending with previous month)
-    month_starts = [first_of_current - pd.DateOffset(months=i) for i in range(12, 0, -1)]
-    month_starts.append(first_of_current)  # Add current month start for the last boundary
-
-    results = []
-    for i in range(12):
-        start = month_starts[i]
-        end = month_starts[i+1]
-        mask = (df["target_date"] > start) & (df["target_date"] <= end)
-        month_df = df[mask]
-        results.append({
-            "report_month": start.strftime("%b-%y"),
-            "missed": (month_df["wo_class"] == "missed").sum() if "wo_class" in month_df.columns else None,
-            "completed": (month_df["wo_class"] == "on_time").sum() if "wo_class" in month_df.columns else None,
-            "generated": len(month_df)
-        })
-
-    return pd.DataFrame(results)
+    trend.insert(0, "report_month", last_12_periods.strftime("%b-%y"))
+    return trend[["report_month", "missed", "completed", "generated"]].reset_index(drop=True)
 
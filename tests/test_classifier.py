@@ -67,5 +67,28 @@ def test_classify_missed():
     result = apply_classification(df)
     assert result["wo_class"].iloc[0] == "missed"
 
+def test_apply_classification_mixed_rows():
+    df = pd.DataFrame([
+        {"status": "CAN", "actual_finish": pd.Timestamp("2023-06-01"), "grace_date": pd.Timestamp("2023-06-10")},
+        {"status": "comp", "actual_finish": pd.Timestamp("2023-06-01"), "grace_date": pd.Timestamp("2023-06-10")},
+        {"status": "CLOSE", "actual_finish": pd.Timestamp("2023-06-12"), "grace_date": pd.Timestamp("2023-06-10")},
+        {"status": "CLOSE", "actual_finish": pd.Timestamp("2023-06-12"), "grace_date": pd.NaT},
+        {"status": "PENDQA", "actual_finish": pd.NaT, "grace_date": pd.Timestamp("2023-06-10")},
+        {"status": "INPRG", "actual_finish": pd.Timestamp("2023-06-01"), "grace_date": pd.Timestamp("2023-06-10")},
+        {"status": None, "actual_finish": pd.Timestamp("2023-06-01"), "grace_date": pd.Timestamp("2023-06-10")},
+    ])
+    expected = ["canceled", "on_time", "missed", "missed", "open", "open", "open"]
+    result = apply_classification(df)
+    assert result["wo_class"].astype(str).tolist() == expected
+
+def test_apply_classification_categorical_status():
+    df = pd.DataFrame({
+        "status": pd.Categorical(["can", "COMP", "INPRG", None]),
+        "actual_finish": [pd.Timestamp("2023-06-01")] * 4,
+        "grace_date": [pd.Timestamp("2023-06-10")] * 4,
+    })
+    result = apply_classification(df)
+    assert result["wo_class"].astype(str).tolist() == ["canceled", "on_time", "open", "open"]
+
 if __name__ == "__main__":
     print("✔️ test_classifier.py ran successfully.")
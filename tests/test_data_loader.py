@@ -7,9 +7,11 @@
 # Requirements:
 #   - Input: Test Excel (.xlsx) or CSV file containing sample work order data.
 #   - Dependencies: pandas, load_work_order_files from scripts/data_loader.
+#   - The Parquet cache is redirected to a temporary directory (cache_dir fixture).
 #
 # Output:
 #   - Asserts that the loader returns a non-empty DataFrame with expected columns.
+#   - Asserts that work order IDs load as Int64 regardless of each file's values.
 #   - Prints a success message if all tests pass.
 #
 # Notes:
@@ -20,10 +22,60 @@
 # tests/test_data_loader.py
 
 import pandas as pd
-from scripts.data_loader import load_work_order_files
+import pytest
+from scripts import data_loader
+from scripts.data_loader import cache_path_for, load_work_order_files, load_all_work_order_files, parse_dates
 
-def test_load_work_order_files_returns_dataframe():
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Points the Parquet cache at a temporary directory so tests never touch data/cache."""
+    path = tmp_path / "cache"
+    monkeypatch.setattr(data_loader, "CACHE_DIR", path)
+    return path
+
+def test_load_work_order_files_returns_dataframe(cache_dir):
     df = load_work_order_files("data/raw/TestQSRData.xlsx")
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
-    assert "work_order" in df.columns  # Swap with actual expected column
\ No newline at end of file
+    assert "work_order" in df.columns  # Swap with actual expected column
+
+def test_load_all_work_order_files_combines_directory(tmp_path, cache_dir):
+    for i, group in enumerate(["MECH", "ELEC"]):
+        pd.DataFrame({
+            "work_order": [i * 10 + 1, i * 10 + 2],
+            "current_status": ["COMP", "CLOSE"],
+            "targ_comp_date": ["2023-06-01", "2023-07-01"],
+            "wo_assigned_group": [group, group],
+        }).to_excel(tmp_path / f"wo_{i}.xlsx", index=False)
+
+    df = load_all_work_order_files(tmp_path)
+    assert df["work_order"].tolist() == [1, 2, 11, 12]
+    assert set(df["group"].cat.categories) == {"MECH", "ELEC"}
+    assert len(list(cache_dir.glob("*.parquet"))) == 2
+
+def test_cache_key_changes_with_cache_version(tmp_path, monkeypatch):
+    workbook = tmp_path / "wo.xlsx"
+    workbook.write_bytes(b"")
+    before = cache_path_for(str(workbook))
+    monkeypatch.setattr(data_loader, "CACHE_VERSION", data_loader.CACHE_VERSION + 1)
+    assert cache_path_for(str(workbook)) != before
+
+def test_parse_dates_accepts_mixed_iso_values():
+    values = pd.Series(["2023-06-01", "2023-06-02 13:45:00", None, "not a date"], dtype=object)
+    result = parse_dates(values)
+    assert result.tolist()[:2] == [pd.Timestamp("2023-06-01"), pd.Timestamp("2023-06-02 13:45")]
+    assert result.iloc[2:].isna().all()
+
+def test_work_order_ids_load_as_int64_whatever_their_values(tmp_path):
+    dtypes = []
+    for i, work_order in enumerate([16777217.0, 10000001.0]):
+        path = tmp_path / f"wo_{i}.csv"
+        pd.DataFrame({
+            "work_order": [work_order, None],
+            "current_status": ["COMP", "CLOSE"],
+            "targ_comp_date": ["2023-06-01", "2023-07-01"],
+        }).to_csv(path, index=False)
+        df = load_work_order_files(str(path))
+        assert df["work_order"].iloc[0] == int(work_order)
+        dtypes.append(df["work_order"].dtype)
+    assert dtypes == ["Int64", "Int64"]
@@ -0,0 +1,57 @@
+# ---------------------------------------------------------------
+# test_slide_generator.py
+#
+# Purpose:
+#   Unit tests for template loading and stoplight classification in scripts/slide_generator.py.
+#
+# Requirements:
+#   - Input: a blank PowerPoint template written to a temporary directory.
+#   - Dependencies: python-pptx, load_template, read_template_bytes and classify_stoplights from scripts/slide_generator.
+#
+# Output:
+#   - Asserts that the template file is read once and each deck is an independent copy.
+#   - Asserts that an edited template (new mtime) is read again.
+#   - Asserts the stoplight thresholds: <=3% green, >3% <=6% yellow, >6% red.
+#
+# Notes:
+#   - Run with pytest for automated testing.
+# ---------------------------------------------------------------
+
+# tests/test_slide_generator.py
+
+import os
+from pptx import Presentation
+from scripts.slide_generator import classify_stoplights, load_template, read_template_bytes
+
+def test_load_template_reads_file_once_and_returns_independent_decks(tmp_path):
+    template_path = tmp_path / "template.pptx"
+    Presentation().save(template_path)
+    read_template_bytes.cache_clear()
+
+    first = load_template(str(template_path))
+    first.slides.add_slide(first.slide_layouts[0])
+    second = load_template(str(template_path))
+
+    assert read_template_bytes.cache_info().misses == 1
+    assert len(first.slides) == 1
+    assert len(second.slides) == 0
+
+def test_load_template_rereads_changed_template(tmp_path):
+    template_path = tmp_path / "template.pptx"
+    Presentation().save(template_path)
+    read_template_bytes.cache_clear()
+    assert len(load_template(str(template_path)).slides) == 0
+
+    edited = Presentation()
+    edited.slides.add_slide(edited.slide_layouts[0])
+    edited.save(template_path)
+    mtime = os.path.getmtime(template_path) + 10
+    os.utime(template_path, (mtime, mtime))
+
+    assert len(load_template(str(template_path)).slides) == 1
+    assert read_template_bytes.cache_info().misses == 2
+
+def test_classify_stoplights_thresholds():
+    levels = classify_stoplights([0.0, 3.0, 3.01, 6.0, 6.01, 100.0])
+    assert levels.dtype == "uint8"
+    assert levels.tolist() == [0, 0, 1, 1, 2, 2]
@@ -22,7 +22,9 @@
 import pandas as pd
 from scripts.summary_generator import (
     generate_monthly_summary,
-    get_extreme_late_work_orders
+    get_extreme_late_work_orders,
+    normalize_wo_class,
+    sort_by_month
 )
 
 def sample_df():
@@ -102,4 +104,20 @@ def test_get_extreme_late_work_orders():
     assert late_df["wo_class"].iloc[0] == "open"
     assert late_df["status"].iloc[0] in ["INPRG", "APPR", "WAPPR"]
 
+def test_sort_by_month_keeps_grand_total_last():
+    unsorted = pd.DataFrame({"Month": ["Mar-24", "Grand Total", "Dec-23", "Jan-24"]})
+    assert sort_by_month(unsorted)["Month"].tolist() == ["Dec-23", "Jan-24", "Mar-24", "Grand Total"]
 
+    presorted = pd.DataFrame({"Month": ["Dec-23", "Jan-24", "Grand Total"]}, index=[4, 5, 6])
+    result = sort_by_month(presorted)
+    assert result["Month"].tolist() == ["Dec-23", "Jan-24", "Grand Total"]
+    assert result.index.tolist() == [0, 1, 2]
+
+def test_normalize_wo_class_cleans_categories():
+    wo_class = pd.Series([" Missed", "on_time", None, "MISSED "], dtype="category")
+    result = normalize_wo_class(wo_class)
+
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.tolist()[:2] == ["missed", "on_time"]
+    assert pd.isna(result.iloc[2])
+    assert result.iloc[3] == "missed"